@@ -1,18 +1,50 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+import asyncio
+import hashlib
+import io
+import zipfile
+import multiprocessing
 import subprocess
 import json
 import os
-import tempfile
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import List, Optional
 from pydantic import BaseModel
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+# ------------------ Execution settings ------------------
+# ATS_WORKERS=0 runs parse/score in a thread of this process instead of a process pool
+ATS_WORKERS = int(os.environ.get("ATS_WORKERS", os.cpu_count() or 2))
+ATS_REQUEST_TIMEOUT = float(os.environ.get("ATS_REQUEST_TIMEOUT", "60"))
+ATS_MAX_PENDING = int(os.environ.get("ATS_MAX_PENDING", str(max(ATS_WORKERS, 1) * 4)))
+# /api/ats/parse?quick=true stops after this many PDF pages / characters of extracted text
+ATS_QUICK_MAX_PAGES = int(os.environ.get("ATS_QUICK_MAX_PAGES", "2"))
+ATS_QUICK_MAX_CHARS = int(os.environ.get("ATS_QUICK_MAX_CHARS", "20000"))
+# /api/ats/score/batch: resumes per request, size cap per zip entry, jobs kept in flight per batch
+ATS_BATCH_MAX_FILES = int(os.environ.get("ATS_BATCH_MAX_FILES", "500"))
+ATS_BATCH_MAX_FILE_MB = float(os.environ.get("ATS_BATCH_MAX_FILE_MB", "10"))
+ATS_BATCH_CONCURRENCY = int(os.environ.get("ATS_BATCH_CONCURRENCY", str(max(ATS_WORKERS, 1) * 2)))
+
+# ------------------ Result cache settings ------------------
+# ATS_CACHE_SIZE=0 disables caching; ATS_CACHE_DB adds a SQLite tier shared across restarts
+ATS_CACHE_SIZE = int(os.environ.get("ATS_CACHE_SIZE", "256"))
+ATS_CACHE_TTL = float(os.environ.get("ATS_CACHE_TTL", "3600"))
+ATS_CACHE_DB = os.environ.get("ATS_CACHE_DB") or None
+ATS_CACHE_DB_MAX_ENTRIES = int(os.environ.get("ATS_CACHE_DB_MAX_ENTRIES", "100000"))
+
+# ------------------ Resume index settings ------------------
+# SQLite file for recruiter candidate search (/api/index/*); unset disables the endpoints
+ATS_RESUME_INDEX_DB = os.environ.get("ATS_RESUME_INDEX_DB") or None
+
 app = FastAPI(title="ResumeForge API", version="1.0.0")
 
 # CORS middleware
@@ -28,43 +60,199 @@ class ScoreRequest(BaseModel):
     job_title: str
     experience_level: str
 
+class CandidateSearchRequest(BaseModel):
+    skills: List[str]
+    top_n: int = 10
+    min_years: Optional[float] = None
+    certifications: List[str] = []
+
+# ------------------ Result cache ------------------
+from python_nlp_service.modules.result_cache import ResultCache, content_hash, config_version
+
+CACHE_VERSION = config_version()
+parse_cache = ResultCache("parse", ATS_CACHE_SIZE, ATS_CACHE_TTL, ATS_CACHE_DB, ATS_CACHE_DB_MAX_ENTRIES) if ATS_CACHE_SIZE > 0 else None
+score_cache = ResultCache("score", ATS_CACHE_SIZE, ATS_CACHE_TTL, ATS_CACHE_DB, ATS_CACHE_DB_MAX_ENTRIES) if ATS_CACHE_SIZE > 0 else None
+
+def cache_key(content, *parts):
+    # hashed as a JSON list: no separator in a job title can make two keys collide
+    return hashlib.sha256(json.dumps([content_hash(content), CACHE_VERSION, *parts]).encode("utf-8")).hexdigest()
+
+async def cache_get(cache, key):
+    """cache.get off the event loop (SQLite reads + JSON decoding); None without a cache."""
+    return await run_in_threadpool(cache.get, key) if cache else None
+
+async def cache_set(cache, key, value):
+    if cache:
+        await run_in_threadpool(cache.set, key, value)
+
+# ------------------ Worker pool ------------------
+_executor = None
+_thread_executor = None  # ATS_WORKERS=0
+_pending = 0
+_running = {}  # process pool -> its in-flight concurrent futures
+_retiring = set()  # background tasks retiring replaced pools
+
+def _create_executor():
+    from python_nlp_service.modules.ats_worker import init_worker
+    return ProcessPoolExecutor(
+        max_workers=ATS_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+    )
+
+@app.on_event("startup")
+async def start_worker_pool():
+    global _executor
+    if ATS_WORKERS > 0:
+        from python_nlp_service.modules.ats_worker import handle_job
+        _executor = _create_executor()
+        # spawn + warm every worker (spaCy load) before the first request arrives;
+        # a worker that cannot import the service fails startup here, not on a request
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(_executor, handle_job, {"type": "ping"}) for _ in range(ATS_WORKERS)
+        ))
+
+@app.on_event("shutdown")
+async def stop_worker_pool():
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    if _thread_executor is not None:
+        _thread_executor.shutdown(wait=False, cancel_futures=True)
+
+def _submit(job):
+    """concurrent.futures.Future of handle_job(job) on the process pool (a thread when ATS_WORKERS=0)."""
+    global _thread_executor
+    from python_nlp_service.modules.ats_worker import handle_job
+
+    if _executor is None:
+        if _thread_executor is None:
+            _thread_executor = ThreadPoolExecutor(thread_name_prefix="ats-job")
+        return _thread_executor.submit(handle_job, job)
+    future = _executor.submit(handle_job, job)
+    running = _running.setdefault(_executor, set())
+    running.add(future)
+    future.add_done_callback(running.discard)
+    return future
+
+def _replace_executor(old, stuck=None):
+    """
+    Swap in a fresh pool for later requests. Concurrent failures of the same
+    pool only replace it once. A broken pool is shut down right away; a pool
+    with a stuck job is retired in the background (see _retire_executor).
+    """
+    global _executor
+    if _executor is not old:
+        return
+    _executor = _create_executor()
+    if stuck is None:
+        old.shutdown(wait=False, cancel_futures=True)
+        _running.pop(old, None)
+    else:
+        task = asyncio.get_running_loop().create_task(_retire_executor(old))
+        _retiring.add(task)
+        task.add_done_callback(_retiring.discard)
+
+async def _retire_executor(old):
+    """
+    Give the old pool's other jobs up to ATS_REQUEST_TIMEOUT to finish, then kill
+    its processes: a running job cannot be cancelled, so this is what frees the
+    worker stuck on a pathological file. Jobs still running fail as crashed.
+    """
+    others = [asyncio.wrap_future(f) for f in list(_running.get(old, ()))]
+    for waiter in others:
+        # their requests report the outcome; only wait here, never log it again
+        waiter.add_done_callback(lambda w: w.cancelled() or w.exception())
+    if others:
+        await asyncio.wait(others, timeout=ATS_REQUEST_TIMEOUT)
+    for process in _pool_processes(old):
+        process.kill()
+    old.shutdown(wait=False, cancel_futures=True)
+    _running.pop(old, None)
+
+def _pool_processes(executor):
+    """
+    The worker processes of a ProcessPoolExecutor. The executor has no public
+    API for this, and shutdown() cannot stop a running job, so killing a stuck
+    worker needs the private _processes map ({pid: Process}). If a Python
+    version drops or renames it, this returns [] and the pool is only shut down.
+    """
+    return list((getattr(executor, "_processes", None) or {}).values())
+
+async def run_job(job, admission_check=True):
+    """
+    Run a parse/score job off the event loop.
+    Raises 503 when ATS_MAX_PENDING jobs are already queued or running,
+    504 when the job exceeds ATS_REQUEST_TIMEOUT seconds.
+    admission_check=False: the caller bounds its own concurrency (batch requests).
+    A job counts as pending until its worker is actually done with it, not until
+    the request gives up on it, so timed-out jobs still hold their admission slot.
+    """
+    global _pending
+
+    if admission_check and _pending >= ATS_MAX_PENDING:
+        raise HTTPException(status_code=503, detail="Server busy, please retry shortly")
+    executor = _executor
+    try:
+        future = _submit(job)
+    except BrokenProcessPool:
+        _replace_executor(executor)
+        raise HTTPException(status_code=500, detail="Worker process crashed")
+    _pending += 1
+    loop = asyncio.get_running_loop()
+
+    def release(_future):
+        global _pending
+        _pending -= 1
+
+    # runs in the pool's thread once the job is really finished (or killed)
+    future.add_done_callback(lambda f: loop.call_soon_threadsafe(release, f))
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=ATS_REQUEST_TIMEOUT)
+    except asyncio.TimeoutError:
+        if executor is not None:
+            _replace_executor(executor, stuck=future)
+        raise HTTPException(status_code=504, detail="Processing timed out")
+    except BrokenProcessPool:
+        # a worker died (e.g. OOM on a huge PDF); replace the pool for later requests
+        _replace_executor(executor)
+        raise HTTPException(status_code=500, detail="Worker process crashed")
+
 @app.get("/")
 async def root():
     return {"message": "ResumeForge API is running"}
 
 @app.post("/api/ats/parse")
-async def parse_resume(file: UploadFile = File(...)):
+async def parse_resume(file: UploadFile = File(...), quick: bool = False):
     """
     Step 1: Just parse the resume without scoring
+    quick=true: only the first ATS_QUICK_MAX_PAGES pages / ATS_QUICK_MAX_CHARS characters
     """
     if not file.filename.lower().endswith(('.pdf', '.docx')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_file:
-        content = await file.read()
-        temp_file.write(content)
-        temp_path = temp_file.name
-    
+
+    # parsed straight from memory: no temp file write/fsync/unlink on the request path
+    content = await file.read()
+
     try:
         print(f"Parsing file: {file.filename}")
-        
-        # Direct import approach - more reliable
-        try:
-            from python_nlp_service.modules.resume_parser import parse_resume as parse_resume_function
-            print("✅ Successfully imported parser")
-        except ImportError as e:
-            print(f"❌ Import failed: {e}")
-            raise HTTPException(status_code=500, detail=f"Parser import failed: {e}")
-        
-        parsed_data = parse_resume_function(temp_path)
+        job = {"type": "parse", "file_bytes": content, "filename": file.filename}
+        if quick:
+            job.update(max_pages=ATS_QUICK_MAX_PAGES, max_chars=ATS_QUICK_MAX_CHARS)
+            key = cache_key(content, "quick", str(ATS_QUICK_MAX_PAGES), str(ATS_QUICK_MAX_CHARS))
+        else:
+            key = cache_key(content)
+        parsed_data = await cache_get(parse_cache, key)
+        if parsed_data is None:
+            parsed_data = await run_job(job)
+            await cache_set(parse_cache, key, parsed_data)
         return JSONResponse(content=parsed_data)
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-            
+
 @app.post("/api/ats/score")
 async def score_resume(file: UploadFile = File(...), job_title: str = "", experience_level: str = ""):
     """
@@ -72,37 +260,233 @@ async def score_resume(file: UploadFile = File(...), job_title: str = "", experi
     """
     if not file.filename.lower().endswith(('.pdf', '.docx')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_file:
-        content = await file.read()
-        temp_file.write(content)
-        temp_path = temp_file.name
-    
+
+    content = await file.read()
+
     try:
         print(f"Scoring file against: {job_title} ({experience_level})")
-        
-        # Direct import approach - same as parser
-        try:
-            from python_nlp_service.modules.ats_scorer import ats_score_verbose
-            print("✅ Successfully imported scorer")
-        except ImportError as e:
-            print(f"❌ Scorer import failed: {e}")
-            raise HTTPException(status_code=500, detail=f"Scorer import failed: {e}")
-        
-        # Call the function directly
-        score_result = ats_score_verbose(temp_path, job_title, experience_level)
+        score_result = await score_content(content, file.filename, job_title, experience_level)
         return JSONResponse(content=score_result)
-        
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+
+async def score_content(content, filename, job_title, experience_level, admission_check=True):
+    """Score one uploaded resume, going through the parse/score caches."""
+    parse_key = cache_key(content)
+    score_key = cache_key(content, job_title, experience_level)
+    score_result = await cache_get(score_cache, score_key)
+    if score_result is None:
+        job = {
+            "type": "score",
+            "file_bytes": content,
+            "filename": filename,
+            "job_title": job_title,
+            "experience_level": experience_level,
+        }
+        # rescoring a known resume against a new title skips the parse step
+        cached_parse = await cache_get(parse_cache, parse_key)
+        if cached_parse is not None:
+            job["resume_data"] = cached_parse
+        score_result = await run_job(job, admission_check=admission_check)
+        await cache_set(score_cache, score_key, score_result)
+        if cached_parse is None:
+            await cache_set(parse_cache, parse_key, score_result["resume_data"])
+    return score_result
+
+@app.post("/api/ats/roles")
+async def best_fit_roles(file: UploadFile = File(...), top_k: int = 10):
+    """
+    Reverse matching: the top_k (Title, ExperienceLevel) pairs from the JD dataset
+    that this resume fits best, ranked by mean JD skill coverage.
+    """
+    if not file.filename.lower().endswith(('.pdf', '.docx')):
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
+    if not 1 <= top_k <= 100:
+        raise HTTPException(status_code=400, detail="top_k must be between 1 and 100")
+
+    content = await file.read()
+
+    try:
+        parse_key = cache_key(content)
+        job = {"type": "roles", "file_bytes": content, "filename": file.filename, "top_k": top_k}
+        cached_parse = await cache_get(parse_cache, parse_key)
+        if cached_parse is not None:
+            job["resume_data"] = cached_parse
+        result = await run_job(job)
+        if cached_parse is None:
+            await cache_set(parse_cache, parse_key, result["resume_data"])
+        return JSONResponse(content=result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# ------------------ Recruiter batch scoring ------------------
+def resumes_from_zip(data):
+    """[(filename, bytes)] for the PDF/DOCX entries of a zip archive, in archive order."""
+    max_bytes = int(ATS_BATCH_MAX_FILE_MB * 1024 * 1024)
+    resumes = []
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            base = os.path.basename(name)
+            if info.is_dir() or name.startswith("__MACOSX/") or base.startswith("."):
+                continue
+            if not base.lower().endswith((".pdf", ".docx")):
+                continue
+            if info.file_size > max_bytes:
+                raise HTTPException(status_code=413, detail=f"{name} exceeds {ATS_BATCH_MAX_FILE_MB} MB")
+            resumes.append((base, zf.read(info)))
+            if len(resumes) > ATS_BATCH_MAX_FILES:
+                break
+    return resumes
+
+@app.post("/api/ats/score/batch")
+async def score_resume_batch(
+    files: Optional[List[UploadFile]] = File(None),
+    archive: Optional[UploadFile] = File(None),
+    job_title: str = "",
+    experience_level: str = "",
+):
+    """
+    Recruiter batch: score many resumes against one job.
+    Resumes come as multipart `files` and/or a .zip `archive`. Every worker resolves
+    and compiles the matched JDs once (ats_scorer.compile_job) and reuses them for
+    the rest of the batch. The response is NDJSON, one line per resume as it finishes:
+        {"index": 0, "filename": "a.pdf", "ok": true, "result": {...}}
+        {"index": 1, "filename": "b.txt", "ok": false, "status": 400, "error": "..."}
+    followed by {"done": true, "total": 2, "failed": 1}.
+    """
+    resumes = [(f.filename, await f.read()) for f in files or []]
+    if archive is not None:
+        try:
+            resumes.extend(resumes_from_zip(await archive.read()))
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail="archive is not a valid zip file")
+    if not resumes:
+        raise HTTPException(status_code=400, detail="No resumes uploaded")
+    if len(resumes) > ATS_BATCH_MAX_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {ATS_BATCH_MAX_FILES} resumes per batch")
+
+    print(f"Batch scoring {len(resumes)} resumes against: {job_title} ({experience_level})")
+    slots = asyncio.Semaphore(max(ATS_BATCH_CONCURRENCY, 1))
+
+    async def score_one(index, filename, content):
+        line = {"index": index, "filename": filename}
+        if not (filename or "").lower().endswith((".pdf", ".docx")):
+            return {**line, "ok": False, "status": 400, "error": "Only PDF and DOCX files are allowed"}
+        async with slots:
+            try:
+                result = await score_content(content, filename, job_title, experience_level, admission_check=False)
+                return {**line, "ok": True, "result": result}
+            except HTTPException as e:
+                return {**line, "ok": False, "status": e.status_code, "error": e.detail}
+            except Exception as e:
+                return {**line, "ok": False, "status": 500, "error": str(e)}
+
+    async def stream():
+        tasks = [asyncio.ensure_future(score_one(i, name, content)) for i, (name, content) in enumerate(resumes)]
+        failed = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                line = await finished
+                if not line["ok"]:
+                    failed += 1
+                yield json.dumps(line) + "\n"
+            yield json.dumps({"done": True, "total": len(resumes), "failed": failed}) + "\n"
+        finally:
+            # client went away: drop the resumes that have not started yet
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+# ------------------ Resume index (candidate search) ------------------
+from python_nlp_service.modules.resume_index import ResumeIndex
+
+resume_index = ResumeIndex(ATS_RESUME_INDEX_DB) if ATS_RESUME_INDEX_DB else None
+
+def require_resume_index():
+    if resume_index is None:
+        raise HTTPException(status_code=404, detail="Resume index is disabled (set ATS_RESUME_INDEX_DB)")
+    return resume_index
+
+@app.post("/api/index/resumes")
+async def index_resume(file: UploadFile = File(...), resume_id: str = ""):
+    """
+    Parse a resume once and add it to the candidate index (re-adding an id replaces it).
+    resume_id defaults to the file's SHA-256.
+    """
+    index = require_resume_index()
+    if not file.filename.lower().endswith(('.pdf', '.docx')):
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
+
+    content = await file.read()
+
+    try:
+        key = cache_key(content)
+        parsed_data = await cache_get(parse_cache, key)
+        if parsed_data is None:
+            parsed_data = await run_job({"type": "parse", "file_bytes": content, "filename": file.filename})
+            await cache_set(parse_cache, key, parsed_data)
+        resume_id = resume_id or content_hash(content)
+        skills = await run_in_threadpool(index.add, resume_id, parsed_data, file.filename)
+        return {"resume_id": resume_id, "filename": file.filename, "skills": skills}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/index/resumes/{resume_id}")
+async def get_indexed_resume(resume_id: str):
+    """The stored parse_resume output of an indexed resume."""
+    parsed_data = await run_in_threadpool(require_resume_index().get, resume_id)
+    if parsed_data is None:
+        raise HTTPException(status_code=404, detail="Resume not found in index")
+    return JSONResponse(content=parsed_data)
+
+@app.delete("/api/index/resumes/{resume_id}")
+async def remove_indexed_resume(resume_id: str):
+    if not await run_in_threadpool(require_resume_index().remove, resume_id):
+        raise HTTPException(status_code=404, detail="Resume not found in index")
+    return {"resume_id": resume_id, "removed": True}
+
+@app.post("/api/index/search")
+async def search_candidates(request: CandidateSearchRequest):
+    """
+    Top-N indexed resumes for a JD's skills, ranked by the share of those skills
+    they have; min_years and certifications (all required) filter candidates.
+    Nothing is re-parsed: only the stored skill postings are read.
+    """
+    index = require_resume_index()
+    if not 1 <= request.top_n <= 1000:
+        raise HTTPException(status_code=400, detail="top_n must be between 1 and 1000")
+    return await run_in_threadpool(
+        index.search, request.skills, request.top_n, request.min_years, request.certifications
+    )
 
 @app.get("/api/health")
 async def health_check():
-    return {"status": "healthy", "service": "ResumeForge API"}
+    # the index lock may be held by a bulk add: never wait for it on the event loop
+    index_stats = await run_in_threadpool(resume_index.stats) if resume_index else None
+    return {
+        "status": "healthy",
+        "service": "ResumeForge API",
+        "workers": ATS_WORKERS,
+        "pending_jobs": _pending,
+        "cache": {
+            "version": CACHE_VERSION,
+            "parse": parse_cache.stats() if parse_cache else None,
+            "score": score_cache.stats() if score_cache else None,
+        },
+        "resume_index": index_stats,
+    }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
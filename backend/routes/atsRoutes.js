@@ -1,11 +1,11 @@
 const express = require('express');
 const multer = require('multer');
-const { spawn } = require('child_process');
 const path = require('path');
 const fs = require('fs');
+const { getWorkerPool, PoolSaturatedError } = require('../utils/pythonWorkerPool');
 
 const router = express.Router();
-const upload = multer({ dest: 'uploads/' }); 
+const upload = multer({ dest: 'uploads/' });
 
 router.post('/score', upload.single('resume'), async (req, res) => {
   if (!req.file) return res.status(400).json({ error: 'No file uploaded' });
@@ -13,26 +13,84 @@ router.post('/score', upload.single('resume'), async (req, res) => {
   const filePath = path.resolve(req.file.path);
 
   try {
-    const py = spawn('python3', ['python_nlp_service/modules/ats_scorer_runner.py', filePath]);
-
-    let result = '';
-    py.stdout.on('data', (data) => {
-      result += data.toString();
+    const result = await getWorkerPool().run({
+      type: 'score',
+      file_path: filePath,
+      // multer stores uploads without an extension; the worker detects the format from this name
+      filename: req.file.originalname,
+      job_title: req.body.job_title || '',
+      experience_level: req.body.experience_level || '',
     });
+    res.json(result);
+  } catch (err) {
+    if (err instanceof PoolSaturatedError) {
+      return res.status(503).json({ error: 'Scoring service busy, try again shortly' });
+    }
+    console.error('Python worker error:', err.message);
+    res.status(500).json({ error: 'Python script failed' });
+  } finally {
+    fs.unlink(filePath, () => {});
+  }
+});
 
-    py.stderr.on('data', (data) => {
-      console.error('Python error:', data.toString());
-    });
+const BATCH_MAX_FILES = parseInt(process.env.ATS_BATCH_MAX_FILES || '500', 10);
 
-    py.on('close', (code) => {
-      fs.unlinkSync(filePath); 
-      if (code !== 0) return res.status(500).json({ error: 'Python script failed' });
-      res.json(JSON.parse(result));
-    });
-  } catch (err) {
-    console.error(err);
-    res.status(500).json({ error: 'Server error' });
+/**
+ * Recruiter batch: score many resumes (multipart field "resumes") against one job.
+ * Streams NDJSON, one line per resume as it finishes, then a summary line:
+ *   {"index": 0, "filename": "a.pdf", "ok": true, "result": {...}}
+ *   {"done": true, "total": 1, "failed": 0}
+ * Each Python worker compiles the job's matched JDs once and reuses them.
+ * Zip uploads are handled by the FastAPI service (POST /api/ats/score/batch).
+ */
+router.post('/score/batch', upload.array('resumes', BATCH_MAX_FILES), async (req, res) => {
+  const files = req.files || [];
+  if (!files.length) return res.status(400).json({ error: 'No files uploaded' });
+
+  const pool = getWorkerPool();
+  const job = { job_title: req.body.job_title || '', experience_level: req.body.experience_level || '' };
+  let next = 0;
+  let failed = 0;
+  let aborted = false;
+  res.on('close', () => { aborted = true; });
+  res.setHeader('Content-Type', 'application/x-ndjson');
+
+  // keep the pool busy without filling its queue: a couple of jobs per worker in flight
+  const lane = async () => {
+    while (next < files.length && !aborted) {
+      const index = next++;
+      const file = files[index];
+      const line = { index, filename: file.originalname };
+      if (!/\.(pdf|docx)$/i.test(file.originalname || '')) {
+        failed++;
+        Object.assign(line, { ok: false, error: 'Only PDF and DOCX files are allowed' });
+        if (!aborted) res.write(JSON.stringify(line) + '\n');
+        continue;
+      }
+      try {
+        // multer stores uploads without an extension; the worker detects the format from filename
+        const result = await pool.run({
+          type: 'score', file_path: path.resolve(file.path), filename: file.originalname, ...job,
+        });
+        Object.assign(line, { ok: true, result });
+      } catch (err) {
+        failed++;
+        Object.assign(line, { ok: false, error: err instanceof PoolSaturatedError ? 'Scoring service busy' : err.message });
+      }
+      if (!aborted) res.write(JSON.stringify(line) + '\n');
+    }
+  };
+
+  try {
+    await Promise.all(Array.from({ length: Math.min(files.length, pool.size * 2) }, lane));
+    if (!aborted) res.end(JSON.stringify({ done: true, total: files.length, failed }) + '\n');
+  } finally {
+    for (const file of files) fs.unlink(path.resolve(file.path), () => {});
   }
 });
 
+router.get('/health', (req, res) => {
+  res.json(getWorkerPool().stats());
+});
+
 module.exports = router;
@@ -0,0 +1,199 @@
+const { spawn } = require('child_process');
+const readline = require('readline');
+const path = require('path');
+
+const WORKER_SCRIPT = path.resolve(__dirname, '../../python_nlp_service/modules/ats_worker.py');
+
+class PoolSaturatedError extends Error {}
+
+/**
+ * Pool of pre-warmed Python scoring workers (python_nlp_service/modules/ats_worker.py).
+ * Each worker loads spaCy, the configs and job_dataset.json once and then serves
+ * line-delimited JSON jobs over stdin/stdout, one job at a time.
+ */
+class PythonWorkerPool {
+  constructor({
+    size = 2,
+    pythonBin = 'python3',
+    maxQueue = 100,
+    jobTimeoutMs = 60000,
+    startupTimeoutMs = 120000,
+    healthCheckIntervalMs = 30000,
+    healthCheckTimeoutMs = 5000,
+    maxJobsPerWorker = 500,
+  } = {}) {
+    this.size = size;
+    this.pythonBin = pythonBin;
+    this.maxQueue = maxQueue;
+    this.jobTimeoutMs = jobTimeoutMs;
+    this.startupTimeoutMs = startupTimeoutMs;
+    this.healthCheckTimeoutMs = healthCheckTimeoutMs;
+    this.maxJobsPerWorker = maxJobsPerWorker;
+
+    this.workers = new Set();
+    this.queue = [];
+    this.nextJobId = 1;
+    this.closed = false;
+
+    for (let i = 0; i < size; i++) this._spawnWorker();
+    this.healthTimer = setInterval(() => this._healthCheck(), healthCheckIntervalMs);
+    this.healthTimer.unref();
+  }
+
+  run(job) {
+    if (this.closed) return Promise.reject(new Error('Worker pool is closed'));
+    if (this.queue.length >= this.maxQueue) {
+      return Promise.reject(new PoolSaturatedError('Scoring queue is full'));
+    }
+    return new Promise((resolve, reject) => {
+      this.queue.push({ job, resolve, reject, timeoutMs: this.jobTimeoutMs });
+      this._dispatch();
+    });
+  }
+
+  stats() {
+    const workers = [...this.workers];
+    return {
+      size: this.size,
+      ready: workers.filter((w) => w.ready).length,
+      busy: workers.filter((w) => w.current).length,
+      queued: this.queue.length,
+    };
+  }
+
+  close() {
+    this.closed = true;
+    clearInterval(this.healthTimer);
+    for (const worker of this.workers) worker.proc.kill();
+    for (const pending of this.queue.splice(0)) pending.reject(new Error('Worker pool is closed'));
+  }
+
+  _spawnWorker() {
+    const proc = spawn(this.pythonBin, [WORKER_SCRIPT], { stdio: ['pipe', 'pipe', 'pipe'] });
+    const worker = { proc, ready: false, current: null, jobsDone: 0, pingPending: null };
+    this.workers.add(worker);
+
+    const startupTimer = setTimeout(() => {
+      if (!worker.ready) this._recycle(worker, 'startup timeout');
+    }, this.startupTimeoutMs);
+
+    readline.createInterface({ input: proc.stdout }).on('line', (line) => {
+      let msg;
+      try {
+        msg = JSON.parse(line);
+      } catch (err) {
+        console.error('Python worker sent invalid JSON:', line.slice(0, 200));
+        return;
+      }
+      if (msg.type === 'ready') {
+        clearTimeout(startupTimer);
+        worker.ready = true;
+        this._dispatch();
+      } else if (msg.type === 'fatal') {
+        console.error('Python worker failed to start:', msg.error);
+      } else {
+        this._onResult(worker, msg);
+      }
+    });
+
+    proc.stderr.on('data', (data) => {
+      console.error('Python worker:', data.toString().trimEnd());
+    });
+
+    proc.on('error', (err) => console.error('Python worker error:', err));
+    proc.on('exit', (code, signal) => {
+      clearTimeout(startupTimer);
+      if (worker.pingPending) clearTimeout(worker.pingPending.timer);
+      worker.pingPending = null;
+      this.workers.delete(worker);
+      if (worker.current) {
+        clearTimeout(worker.current.timer);
+        worker.current.reject(new Error(`Python worker exited (${signal || code})`));
+        worker.current = null;
+      }
+      if (!this.closed) {
+        // back off a little so a worker that crashes on import does not spin
+        setTimeout(() => {
+          if (!this.closed && this.workers.size < this.size) this._spawnWorker();
+        }, 1000);
+      }
+    });
+  }
+
+  _onResult(worker, msg) {
+    if (worker.pingPending && msg.id === worker.pingPending.id) {
+      clearTimeout(worker.pingPending.timer);
+      worker.pingPending = null;
+      // jobs queued while the ping was in flight were skipped by _dispatch
+      this._dispatch();
+      return;
+    }
+    const current = worker.current;
+    if (!current || msg.id !== current.id) return;
+    clearTimeout(current.timer);
+    worker.current = null;
+    worker.jobsDone += 1;
+    if (msg.ok) current.resolve(msg.result);
+    else current.reject(Object.assign(new Error(msg.error), { traceback: msg.traceback }));
+
+    if (worker.jobsDone >= this.maxJobsPerWorker) this._recycle(worker, 'max jobs reached');
+    else this._dispatch();
+  }
+
+  _dispatch() {
+    for (const worker of this.workers) {
+      if (!this.queue.length) return;
+      if (!worker.ready || worker.current || worker.pingPending) continue;
+      const pending = this.queue.shift();
+      const id = this.nextJobId++;
+      worker.current = {
+        id,
+        resolve: pending.resolve,
+        reject: pending.reject,
+        timer: setTimeout(() => {
+          pending.reject(new Error('Scoring job timed out'));
+          worker.current = null;
+          this._recycle(worker, 'job timeout');
+        }, pending.timeoutMs),
+      };
+      worker.proc.stdin.write(JSON.stringify({ ...pending.job, id }) + '\n');
+    }
+  }
+
+  _healthCheck() {
+    for (const worker of this.workers) {
+      if (!worker.ready || worker.current || worker.pingPending) continue;
+      const id = this.nextJobId++;
+      worker.pingPending = {
+        id,
+        timer: setTimeout(() => this._recycle(worker, 'health check timeout'), this.healthCheckTimeoutMs),
+      };
+      worker.proc.stdin.write(JSON.stringify({ id, type: 'ping' }) + '\n');
+    }
+  }
+
+  _recycle(worker, reason) {
+    console.error(`Recycling Python worker ${worker.proc.pid}: ${reason}`);
+    worker.ready = false;
+    if (worker.pingPending) clearTimeout(worker.pingPending.timer);
+    worker.proc.kill();
+    // replacement is spawned from the 'exit' handler
+  }
+}
+
+let sharedPool = null;
+
+const getWorkerPool = () => {
+  if (!sharedPool) {
+    sharedPool = new PythonWorkerPool({
+      size: parseInt(process.env.PY_WORKERS, 10) || 2,
+      pythonBin: process.env.PYTHON_BIN || 'python3',
+      maxQueue: parseInt(process.env.PY_MAX_QUEUE, 10) || 100,
+      jobTimeoutMs: parseInt(process.env.PY_JOB_TIMEOUT_MS, 10) || 60000,
+      maxJobsPerWorker: parseInt(process.env.PY_MAX_JOBS_PER_WORKER, 10) || 500,
+    });
+  }
+  return sharedPool;
+};
+
+module.exports = { PythonWorkerPool, PoolSaturatedError, getWorkerPool };
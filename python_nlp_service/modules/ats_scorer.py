@@ -10,6 +10,12 @@ sys.path.insert(0, str(project_root))
 # NOW import your modules
 try:
     from python_nlp_service.modules.resume_parser import parse_resume
+    from python_nlp_service.modules.jd_index import JobIndex, normalize_text
+    from python_nlp_service.modules.role_index import RoleIndex
+    from python_nlp_service.modules.fuzzy_matcher import FuzzySkillIndex, fuzzy_pair_match
+    from python_nlp_service.modules.config_loader import CONFIG
+    from python_nlp_service.modules.nlp_provider import NLP_PROVIDER
+    from python_nlp_service.modules.similarity_scorer import SKLEARN_AVAILABLE, resume_text
     print("✅ Successfully imported resume_parser")
 except ImportError as e:
     print(f"❌ Failed to import resume_parser: {e}")
@@ -18,35 +24,29 @@ except ImportError as e:
 # Rest of your existing imports
 import re
 import json
-import spacy
 from collections import Counter
-from difflib import SequenceMatcher
+from functools import cached_property, lru_cache
+from itertools import islice
 from datetime import datetime, timezone
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-# Load spaCy model with error handling
+# optional: vectorized multi-JD scoring
 try:
-    nlp = spacy.load("en_core_web_sm")
-    print("✅ spaCy model loaded successfully")
-except OSError:
-    print("❌ Warning: spaCy model 'en_core_web_sm' not found. Please run: python -m spacy download en_core_web_sm")
-    # Create a dummy nlp object to prevent crashes
-    nlp = None
-except Exception as e:
-    print(f"❌ Warning: Could not load spaCy model: {e}")
-    nlp = None
+    import numpy as np
+    from python_nlp_service.modules.jd_matrix import JDSkillMatrix, JDRows, row_sums
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+BASE_DIR = Path(__file__).resolve().parent.parent
 
 # ------------------ Load Configs ------------------
+# skills / certs / verbs come from the shared registry (one copy per process, same objects as resume_parser)
+CERT_INDEX = CONFIG.get("cert_index")
 try:
-    with open(BASE_DIR / "config/certifications.json", "r", encoding="utf-8") as f:
-        CERTIFICATIONS_LIST = [c.lower() for c in json.load(f)]
-
-    with open(BASE_DIR / "config/action_verbs.json", "r", encoding="utf-8") as f:
-        ACTION_VERBS_LIST = [v.lower() for v in json.load(f)]
-
-    with open(BASE_DIR / "config/synonym_skills.json", "r", encoding="utf-8") as f:
-        SKILL_SYNONYMS = json.load(f)
+    CERTIFICATIONS_LIST = CERT_INDEX.certs
+    ACTION_VERBS_LIST = [v.lower() for v in CONFIG.get("action_verbs")]
+    SKILL_SYNONYMS = CONFIG.get("skill_synonyms")
 
     with open(BASE_DIR / "datasets/job_descriptions/job_dataset.json", "r", encoding="utf-8") as f:
         JOB_DATASET = json.load(f)
@@ -65,26 +65,60 @@ except Exception as e:
     SKILL_SYNONYMS = {}
     JOB_DATASET = []
 
+# lowercase variant -> canonical skill (shared with skills_standardizer)
+SKILL_LOOKUP = CONFIG.get("skill_lookup") if SKILL_SYNONYMS else {}
+
+# title / experience-level lookup index (built once per process)
+JOB_INDEX = JobIndex(JOB_DATASET)
+
+# unmatched titles score against the k nearest JDs (CONFIG "jd_neighbours") instead of an empty stub;
+# JD_FALLBACK_K=0 restores the stub
+JD_FALLBACK_K = int(os.environ.get("JD_FALLBACK_K", "25"))
+JD_FALLBACK_MIN_SIMILARITY = float(os.environ.get("JD_FALLBACK_MIN_SIMILARITY", "0.3"))
+
 # ------------------ Helper Functions ------------------
 
 def fuzzy_match(a, b):
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio() > 0.75
+    return fuzzy_pair_match(a.lower(), b.lower())
 
 def normalize_skill(skill):
     """Map skill to canonical form if in synonyms list"""
-    s_lower = skill.lower()
-    for canonical, variants in SKILL_SYNONYMS.items():
-        if s_lower == canonical.lower() or s_lower in [v.lower() for v in variants]:
-            return canonical
-    return skill
+    return SKILL_LOOKUP.get(skill.lower(), skill)
+
+# JD skill sets as a sparse matrix for bulk scoring (built once per process)
+JD_MATRIX = JDSkillMatrix(JOB_DATASET, normalize_skill) if NUMPY_AVAILABLE else None
+
+# ------------------ Batched spaCy processing ------------------
+# verb lookup only needs POS + lemma (tok2vec -> tagger -> attribute_ruler -> lemmatizer);
+# the model itself is shared with resume_parser and loaded on first use
+VERB_NLP = NLP_PROVIDER.view("tagger", "attribute_ruler", "lemmatizer")
+
+def build_doc_cache(texts, batch_size=64):
+    """
+    Run every distinct text through VERB_NLP.pipe once (parser and NER disabled).
+    Returns {text: Doc}; pass it as `docs=` to share the parses across consumers.
+    """
+    if not VERB_NLP.available:
+        return {}
+    unique = list(dict.fromkeys(t or "" for t in texts))
+    return dict(zip(unique, VERB_NLP.pipe(unique, batch_size=batch_size)))
 
 # ------------------ Action verbs extraction ------------------
-def extract_action_verbs(text, strict=False):
+# "spacy": POS-tag + lemmatize, then match lemmas against ACTION_VERBS_LIST (reference path)
+# "table": look words up in the precomputed inflection table, no spaCy at all;
+#          see python_nlp_service/scripts/eval_action_verbs.py for agreement on a corpus
+ACTION_VERB_MODE = os.environ.get("ACTION_VERB_MODE", "spacy")
+
+def extract_action_verbs(text, strict=False, docs=None, mode=None):
     """Return action verbs from text (matched against configured list)"""
-    if nlp is None:
+    if (mode or ACTION_VERB_MODE) == "table":
+        return CONFIG.get("action_verb_table").find(text, strict=strict)
+    if not VERB_NLP.available:
         return []  # Return empty list if spaCy not available
     
-    doc = nlp(text or "")
+    doc = docs.get(text or "") if docs else None
+    if doc is None:
+        doc = VERB_NLP(text or "")
     verbs_in_text = set()
     for token in doc:
         if token.pos_ == "VERB":
@@ -105,18 +139,19 @@ def extract_buzzwords(text, skills_list):
     """Return canonical skills present in text using synonyms mapping."""
     words = re.findall(r'\b\w[\w\+\.\#]*\b', text or "")
     matched = set()
-    skills_lower = [s.lower() for s in skills_list]
+    skills_lower = {s.lower() for s in skills_list}
 
     # single-word matching (original logic)
-    for w in words:
+    for w in set(words):
         norm = normalize_skill(w)
         if norm.lower() in skills_lower:
             matched.add(norm)
 
     # multi-word skills detection
+    text_lower = (text or "").lower()
     for skill in skills_list:
         if len(skill.split()) > 1:
-            if skill.lower() in text.lower():
+            if skill.lower() in text_lower:
                 matched.add(skill)
 
     return sorted(matched)
@@ -132,7 +167,10 @@ def repeated_words(text, only_words=None):
     return {w: c for w, c in counter.items() if c > 1}
 
 # ------------------ Project analysis ------------------
-def analyze_projects(project_text):
+def split_project_points(project_text):
+    return [p.strip() for p in re.split(r'\u27a2|[\n•]', project_text or "") if p.strip()]
+
+def analyze_projects(project_text, docs=None):
     """
     Score each project bullet for:
       - action verb present
@@ -140,13 +178,13 @@ def analyze_projects(project_text):
       - numeric/metric present
       - detect links (live demos)
     """
-    points = [p.strip() for p in re.split(r'\u27a2|[\n•]', project_text or "") if p.strip()]
+    points = split_project_points(project_text)
     total_score = 0.0
     contextual_matches = 0
     quantified_counts = 0
     for p in points:
         score = 0
-        verbs = extract_action_verbs(p)
+        verbs = extract_action_verbs(p, docs=docs)
         skills_here = extract_buzzwords(p, SKILL_SYNONYMS.keys())
         has_number = bool(re.search(r'\d+%?|\d+\.\d+', p))
         # +1 each
@@ -172,12 +210,14 @@ def analyze_projects(project_text):
     }
 
 # ------------------ Resume stats ------------------
-def resume_stats(text):
+def resume_stats(text, docs=None, action_verbs=None):
     num_words = len((text or "").split())
     num_chars = len(text or "")
     contains_numbers = bool(re.search(r'\d+', text or ""))
     # density: ratio of action verbs & skills / total words
-    action_verbs_count = len(extract_action_verbs(text))
+    if action_verbs is None:
+        action_verbs = extract_action_verbs(text, docs=docs)
+    action_verbs_count = len(action_verbs)
     buzzwords_count = len(extract_buzzwords(text, SKILL_SYNONYMS.keys()))
     density = (action_verbs_count + buzzwords_count) / num_words if num_words else 0.0
     return {"num_words": num_words, "num_chars": num_chars, "contains_numbers": contains_numbers, "density": density}
@@ -195,17 +235,20 @@ def detect_contacts(text):
     return contacts
 
 # ------------------ Skill matching ------------------
-def match_skills(resume_skills, jd_skills):
-    norm_resume = [normalize_skill(s) for s in (resume_skills or [])]
+def build_skill_index(resume_skills):
+    """Fuzzy-match index over the normalized resume skills (build once per request)."""
+    return FuzzySkillIndex(normalize_skill(s) for s in (resume_skills or []))
+
+def match_skills(resume_skills, jd_skills, skill_index=None):
+    if skill_index is None:
+        skill_index = build_skill_index(resume_skills)
     norm_jd = [normalize_skill(s) for s in (jd_skills or [])]
 
     matched, unmatched = set(), set(norm_jd)
     for jd_skill in norm_jd:
-        for rs in norm_resume:
-            if jd_skill.lower() == rs.lower() or fuzzy_match(jd_skill, rs):
-                matched.add(jd_skill)
-                unmatched.discard(jd_skill)
-                break
+        if skill_index.matches(jd_skill):
+            matched.add(jd_skill)
+            unmatched.discard(jd_skill)
     score = len(matched) / len(norm_jd) * 100 if norm_jd else 0
     return {"matched": sorted(matched), "unmatched": sorted(unmatched), "score_percent": round(score, 2)}
 
@@ -222,10 +265,11 @@ def evaluate_certifications(resume_certs, jd_specific_certs=None):
 
     # Match against JD-specific if provided
     if jd_specific_certs:
-        present = [c for c in resume_certs_lower if c in [d.lower() for d in jd_specific_certs]]
+        jd_certs_lower = {d.lower() for d in jd_specific_certs}
+        present = [c for c in resume_certs_lower if c in jd_certs_lower]
         score = len(present) / len(jd_specific_certs) if jd_specific_certs else 0
     else:
-        present = [c for c in resume_certs_lower if c in CERTIFICATIONS_LIST]
+        present = [c for c in resume_certs_lower if c in CERT_INDEX]
         score = len(present) / len(CERTIFICATIONS_LIST) if CERTIFICATIONS_LIST else 0
 
     return min(score, 1.0), present
@@ -299,18 +343,19 @@ def bell_curve_length_score(num_words):
         return 1.0
 
 # ------------------ ATS score calculation ------------------
-def calculate_ats_score(metrics, weights=None, bonus_weights=None):
-    if weights is None:
-        weights = {
-            "skills": 0.35,
-            "action_verbs": 0.15,
-            "buzzwords": 0.10,
-            "projects": 0.10,
-            "education": 0.10,
-            "certifications": 0.10,
-            "resume_length": 0.08,
-            "summary": 0.02
-        }
+DEFAULT_SCORE_WEIGHTS = {
+    "skills": 0.35,
+    "action_verbs": 0.15,
+    "buzzwords": 0.10,
+    "projects": 0.10,
+    "education": 0.10,
+    "certifications": 0.10,
+    "resume_length": 0.08,
+    "summary": 0.02
+}
+
+def _ats_total(metrics, weights):
+    """Weighted total; metric values may be floats or NumPy arrays (one entry per JD)."""
     repetition_factor = 1 - min(metrics.get("repetition_ratio", 0), 0.15)
     core_total = sum([
         metrics.get("skills_score", 0) * weights["skills"],
@@ -337,141 +382,355 @@ def calculate_ats_score(metrics, weights=None, bonus_weights=None):
     formatting_bonus = metrics.get("formatting_score", 0) * 0.02
     contacts_bonus = metrics.get("contacts_score", 0) * 0.02
 
-    total = core_total + section_bonus + contextual_bonus + recency_bonus_v + seniority_bonus + quantified_bonus + formatting_bonus + contacts_bonus
+    return core_total + section_bonus + contextual_bonus + recency_bonus_v + seniority_bonus + quantified_bonus + formatting_bonus + contacts_bonus
+
+def calculate_ats_score(metrics, weights=None, bonus_weights=None):
+    total = _ats_total(metrics, weights if weights is not None else DEFAULT_SCORE_WEIGHTS)
     total_pct = min(total * 100, 100)
     return round(total_pct)
 
+def calculate_ats_scores(metrics, weights=None):
+    """Bulk calculate_ats_score: same arithmetic, applied to per-JD metric arrays."""
+    total = _ats_total(metrics, weights if weights is not None else DEFAULT_SCORE_WEIGHTS)
+    total_pct = np.minimum(total * 100, 100)
+    # np.rint rounds half to even, like round()
+    return [int(v) for v in np.rint(total_pct)]
+
 # ------------------ Suggestions ------------------
-def generate_suggestions(resume_data, jd_skills=[]):
+def generate_suggestions(resume_data, jd_skills=[], analysis=None):
+    analysis = analysis or ResumeAnalysis(resume_data)
     suggestions = []
     skills_missing = set(jd_skills) - set(resume_data.get("skills", []))
     if skills_missing:
         suggestions.append(f"Consider adding missing skills from JD: {', '.join(skills_missing)}")
-    verbs_in_resume = set(extract_action_verbs(resume_data.get("projects", "") + "\n" + resume_data.get("achievements", "")))
+    verbs_in_resume = set(analysis.action_verbs)
     verbs_missing = set(ACTION_VERBS_LIST) - verbs_in_resume
     if verbs_missing:
         suggestions.append(f"Use more varied action verbs like: {', '.join(list(verbs_missing)[:10])}...")
-    resume_certs = [c.lower() for c in resume_data.get("certifications", [])]
-    missing_certs = [c for c in CERTIFICATIONS_LIST if c.lower() not in resume_certs]
+    resume_certs = {c.lower() for c in resume_data.get("certifications", [])}
+    # only the first five are shown
+    missing_certs = list(islice((c for c in CERTIFICATIONS_LIST if c not in resume_certs), 5))
     if missing_certs:
         suggestions.append(f"Add relevant certifications: {', '.join(missing_certs[:5])}...")
-    project_analysis = analyze_projects(resume_data.get("projects", ""))
+    project_analysis = analysis.project_analysis
     if project_analysis["num_points"] < 3:
         suggestions.append("Add more points in projects section (less than 3 detected)")
     if project_analysis["avg_point_score"] < 0.5:
         suggestions.append("Enhance project bullets with numbers, skills, and action verbs")
-    stats = resume_stats(resume_data.get("projects", "") + "\n" + resume_data.get("achievements", ""))
+    stats = analysis.stats
     if stats["num_words"] < 300:
         suggestions.append("Consider adding more details; resume is quite short (<300 words)")
-    repetitions = repeated_words(resume_data.get("projects", "") + "\n" + resume_data.get("achievements", ""), only_words=verbs_in_resume)
+    repetitions = analysis.repetitions
     if repetitions:
         suggestions.append(f"Reduce repeated action verbs: {', '.join(list(repetitions.keys())[:10])}...")
     if project_analysis.get("contains_links") is False:
         suggestions.append("Add live demo / project links if available (GitHub, Vercel, Netlify) to increase credibility")
     return suggestions
 
-def normalize_text(s):
+# ------------------ Per-request analysis context ------------------
+class ResumeAnalysis:
     """
-    Normalize text for loose matching:
-    - lowercase
-    - remove spaces, hyphens, symbols
+    Memoized resume-level features for one scoring request.
+    None of these depend on the JD, so each is computed at most once however
+    many JDs matched; only seniority (JD title) is cached per distinct title.
     """
-    return re.sub(r'[^a-z0-9]', '', (s or '').lower())
+
+    def __init__(self, resume_data, batch_nlp=True):
+        self.resume_data = resume_data
+        self.batch_nlp = batch_nlp
+        self._seniority_by_title = {}
+
+    @cached_property
+    def projects_text(self):
+        return self.resume_data.get("projects", "") or ""
+
+    @cached_property
+    def achievements_text(self):
+        return self.resume_data.get("achievements", "") or ""
+
+    @cached_property
+    def text_combined(self):
+        return self.projects_text + "\n" + self.achievements_text
+
+    @cached_property
+    def raw_text(self):
+        return self.resume_data.get("raw_text", "") or ""
+
+    @cached_property
+    def docs(self):
+        if not self.batch_nlp or ACTION_VERB_MODE == "table":
+            return None
+        return build_doc_cache(split_project_points(self.projects_text) + [self.text_combined])
+
+    @cached_property
+    def skill_index(self):
+        return build_skill_index(self.resume_data.get("skills", []))
+
+    @cached_property
+    def action_verbs(self):
+        return extract_action_verbs(self.text_combined, docs=self.docs)
+
+    @cached_property
+    def buzzwords(self):
+        return extract_buzzwords(self.text_combined, self.resume_data.get("skills", []))
+
+    @cached_property
+    def project_analysis(self):
+        return analyze_projects(self.projects_text, docs=self.docs)
+
+    @cached_property
+    def repetitions(self):
+        return repeated_words(self.text_combined, only_words=self.action_verbs)
+
+    @cached_property
+    def repetition_ratio(self):
+        words = self.text_combined.split()
+        return sum([self.repetitions[w] - 1 for w in self.repetitions]) / len(words) if words else 0
+
+    @cached_property
+    def stats(self):
+        return resume_stats(self.text_combined, action_verbs=self.action_verbs)
+
+    @cached_property
+    def contacts_score(self):
+        contacts = detect_contacts(self.raw_text)
+        return sum(1 for v in contacts.values() if v) / len(contacts) if contacts else 0
+
+    def seniority_score(self, jd_title):
+        if jd_title not in self._seniority_by_title:
+            self._seniority_by_title[jd_title] = seniority_match_bonus(jd_title, self.raw_text)
+        return self._seniority_by_title[jd_title]
+
+    @cached_property
+    def base_metrics(self):
+        """JD-independent part of the metrics dict consumed by calculate_ats_score."""
+        pa = self.project_analysis
+        rd = self.resume_data
+        return {
+            "action_verbs_score": min(len(set(self.action_verbs)) / 10.0, 1.0),
+            "projects_score": min(pa["avg_point_score"], 1.0),
+            "education_score": 1.0 if rd.get("education") else 0.0,
+            "repetition_ratio": self.repetition_ratio,
+            "resume_length_score": bell_curve_length_score(self.stats["num_words"]),
+            "summary_score": 1.0 if rd.get("summary") else 0.0,
+            "contextual_score": (pa.get("contextual_matches", 0) / pa.get("num_points", 1)) if pa.get("num_points", 0) else 0.0,
+            "recency_score": recency_bonus(pa),
+            "quantified_score": quantified_impact_bonus(pa),
+            "formatting_score": formatting_check_bonus(self.projects_text, self.achievements_text, self.raw_text),
+            "contacts_score": self.contacts_score,
+            "projects_present": bool(rd.get("projects", "")),
+            "achievements_present": bool(rd.get("achievements", "")),
+            "skills_present": bool(rd.get("skills", [])),
+            "project_links_present": pa.get("contains_links", False),
+        }
+
+    def jd_metrics(self, jd):
+        """Full metrics for one JD: base_metrics plus the JD-dependent terms."""
+        jd_skills = jd.get("Skills", [])
+        skills_match = match_skills(self.resume_data.get("skills", []), jd_skills, skill_index=self.skill_index)
+        certifications_score, valid_certs = evaluate_certifications(self.resume_data.get("certifications", []), jd_specific_certs=jd_skills)
+        metrics = dict(self.base_metrics)
+        metrics.update({
+            "skills_score": skills_match["score_percent"] / 100.0,
+            "buzzwords_score": min(len(self.buzzwords) / len(jd_skills), 1.0) if jd_skills else 1.0,
+            "certifications_score": certifications_score,
+            "seniority_score": self.seniority_score(jd.get("Title", "")),
+        })
+        return metrics, skills_match, valid_certs
+
+# ------------------ Vectorized multi-JD scoring ------------------
+def score_jds_vectorized(analysis, positions, rows=None):
+    """
+    Score the resume against the JD_MATRIX rows at `positions` in bulk.
+    Returns (all_scores, all_skills_matched, all_valid_certs) identical to
+    running match_skills / evaluate_certifications / calculate_ats_score per JD.
+    Each distinct JD skill is fuzzy-matched against the resume only once.
+    rows: precomputed JDRows for `positions` (see CompiledJob).
+    """
+    m = JD_MATRIX
+    rd = analysis.resume_data
+    if rows is None:
+        rows = JDRows(m, positions)
+    has_skills = rows.has_skills
+    safe_lengths = rows.safe_lengths
+
+    # skills: one match decision per distinct normalized JD skill
+    flat, offsets = rows.skill_flat, rows.skill_offsets
+    decision = np.zeros(len(m.skill_vocab), dtype=bool)
+    for sid in rows.skill_ids:
+        decision[sid] = analysis.skill_index.matches(m.skill_vocab[sid])
+    hits = decision[flat]
+    matched_counts = row_sums(hits, offsets)
+    pct = np.where(has_skills, matched_counts / safe_lengths * 100, 0.0)
+    uniq_pct, inverse = np.unique(pct, return_inverse=True)
+    score_percent = [round(float(v), 2) for v in uniq_pct]
+
+    all_skills_matched = []
+    for r in range(len(rows)):
+        row = flat[offsets[r]:offsets[r + 1]]
+        row_hits = hits[offsets[r]:offsets[r + 1]]
+        all_skills_matched.append({
+            "matched": sorted(m.skill_vocab[sid] for sid, hit in zip(row, row_hits) if hit),
+            "unmatched": sorted(m.skill_vocab[sid] for sid, hit in zip(row, row_hits) if not hit),
+            "score_percent": score_percent[inverse[r]] if has_skills[r] else 0,
+        })
+    skills_score = np.array([d["score_percent"] for d in all_skills_matched], dtype=np.float64) / 100.0
+
+    # certifications: resume certs (with multiplicity) found in each JD's lowercased skills
+    resume_certs = [c.lower() for c in (rd.get("certifications", []) or [])]
+    all_valid_certs = []
+    if resume_certs:
+        cert_weight = np.zeros(len(m.cert_vocab), dtype=np.float64)
+        for c in resume_certs:
+            if c in m.cert_id_of:
+                cert_weight[m.cert_id_of[c]] += 1
+        cert_flat, cert_offsets = rows.cert_flat, rows.cert_offsets
+        present_counts = row_sums(cert_weight[cert_flat], cert_offsets)
+        certifications_score = np.minimum(present_counts / safe_lengths, 1.0)
+        seen = set(cert_flat[cert_weight[cert_flat] > 0].tolist())
+        all_valid_certs.extend(m.cert_vocab[cid] for cid in seen)
+        if not has_skills.all():
+            # JDs without skills fall back to the global certifications list
+            global_score, global_present = evaluate_certifications(resume_certs)
+            certifications_score = np.where(has_skills, certifications_score, global_score)
+            all_valid_certs.extend(global_present)
+    else:
+        certifications_score = np.zeros(len(rows), dtype=np.float64)
+
+    seniority = np.array([analysis.seniority_score(m.titles[t]) for t in rows.title_ids], dtype=np.float64)[rows.title_inverse]
+
+    metrics = dict(analysis.base_metrics)
+    metrics.update({
+        "skills_score": skills_score,
+        "buzzwords_score": np.where(has_skills, np.minimum(len(analysis.buzzwords) / safe_lengths, 1.0), 1.0),
+        "certifications_score": certifications_score,
+        "seniority_score": seniority,
+    })
+    return calculate_ats_scores(metrics), all_skills_matched, all_valid_certs
+
+# ------------------ Precompiled job targets ------------------
+class CompiledJob:
+    """
+    Everything in a score that depends only on (job_title, experience_level):
+    the title/level lookup, the matched JDs (the nearest JDs when no title matches,
+    or the empty fallback JD when none are close enough) and their JD_MATRIX rows.
+    Built once per job and shared by every resume scored against it.
+    """
+
+    def __init__(self, job_title="", experience_level=""):
+        self.job_title = job_title
+        self.experience_level = experience_level
+        self.positions = JOB_INDEX.lookup_positions(job_title, experience_level)
+        self.match = "title" if self.positions else "none"
+        if not self.positions and JD_FALLBACK_K > 0 and JOB_DATASET:
+            nearest = CONFIG.get("jd_neighbours").nearest_positions(
+                job_title, experience_level, k=JD_FALLBACK_K, min_similarity=JD_FALLBACK_MIN_SIMILARITY,
+            )
+            if nearest:
+                # dataset order, like title matches (nearest_positions ranks by similarity)
+                self.positions = sorted(pos for pos, _ in nearest)
+                self.match = "nearest"
+        self.matched_jds = [JOB_DATASET[pos] for pos in self.positions]
+        # JD fallback if no match
+        self.relevant_jds = self.matched_jds or [{"Title": job_title, "ExperienceLevel": experience_level, "Skills": []}]
+
+    @cached_property
+    def rows(self):
+        return JDRows(JD_MATRIX, self.positions) if JD_MATRIX is not None and self.positions else None
+
+    @cached_property
+    def text_rows(self):
+        """The matched JDs' TF-IDF vectors, sliced out of jd_text_model() once per job."""
+        model = jd_text_model()
+        return model.rows(self.positions) if model is not None and self.positions else None
+
+@lru_cache(maxsize=64)
+def compile_job(job_title="", experience_level=""):
+    """Memoized per process: a recruiter batch compiles its job once per worker, not once per resume."""
+    return CompiledJob(job_title, experience_level)
+
+@lru_cache(maxsize=1)
+def jd_text_model():
+    """Corpus-fitted TF-IDF + JD vectors for text similarity, loaded on first use (None without scikit-learn)."""
+    if not (JOB_DATASET and SKLEARN_AVAILABLE):
+        return None
+    try:
+        return CONFIG.get("jd_text_model")
+    except Exception as e:
+        print(f"❌ Could not build the JD text model: {e}")
+        return None
+
+# ------------------ Best-fit roles ------------------
+@lru_cache(maxsize=1)
+def role_index():
+    """Skill -> (Title, ExperienceLevel) inverted index over JOB_DATASET, built on first use."""
+    return RoleIndex(JOB_DATASET, normalize_skill)
+
+def best_fit_roles(resume_file_path=None, top_k=10, filename=None, resume_data=None):
+    """
+    Reverse matching: the top_k (Title, ExperienceLevel) roles whose JDs this
+    resume's skills cover best, without having to guess a job_title first.
+    resume_file_path / filename / resume_data: as in ats_score_verbose.
+    """
+    if resume_data is None:
+        resume_data = parse_resume(resume_file_path, filename=filename)
+    skills = {normalize_skill(s) for s in resume_data.get("skills", []) or []}
+    index = role_index()
+    return {
+        "roles": index.top_roles(skills, top_k),
+        "num_roles": len(index),
+        "resume_skills": sorted(skills),
+        "resume_data": resume_data,
+    }
 
 # ------------------ Main ATS verbose scorer ------------------
-def ats_score_verbose(resume_file_path, job_title="", experience_level=""):
-    print(f"Starting ATS scoring for: {resume_file_path}")
+def ats_score_verbose(resume_file_path, job_title="", experience_level="", batch_nlp=True, vectorized=True, filename=None, resume_data=None):
+    """
+    Score a resume file against every JD matching (job_title, experience_level).
+    resume_file_path: a path, or the file as bytes / a binary stream (see parse_resume;
+    pass `filename` for in-memory input).
+    batch_nlp: parse the project bullets and combined section text with a single
+    VERB_NLP.pipe call and share the Docs across all consumers (False = one VERB_NLP() per call).
+    vectorized: score all matched JDs in bulk via JD_MATRIX (needs NumPy).
+    resume_data: parse_resume output for this file (e.g. from the result cache); skips parsing.
+    """
+    source_label = resume_file_path if isinstance(resume_file_path, (str, Path)) else (filename or "<in-memory upload>")
+    print(f"Starting ATS scoring for: {source_label}")
     print(f"Job Title: {job_title}, Experience Level: {experience_level}")
     
-    resume_data = parse_resume(resume_file_path)
-    text_combined = (resume_data.get("projects", "") or "") + "\n" + (resume_data.get("achievements", "") or "")
-    raw_text = resume_data.get("raw_text", "") or ""
-
-    input_title = normalize_text(job_title)
-    input_exp = normalize_text(experience_level)
-
-    relevant_jds = [
-        jd for jd in JOB_DATASET
-        if input_title in normalize_text(jd.get("Title", ""))
-        and input_exp in normalize_text(jd.get("ExperienceLevel", ""))
-    ]
-
-    print(f"Matched JDs: {len(relevant_jds)}")
-
-    # JD fallback if no match
-    if not relevant_jds:
-        relevant_jds = [{"Title": job_title, "ExperienceLevel": experience_level, "Skills": []}]
-
-    action_verbs = extract_action_verbs(text_combined)
-    buzzwords = extract_buzzwords(text_combined, resume_data.get("skills", []))
-    project_analysis = analyze_projects(resume_data.get("projects", ""))
-    all_reps = repeated_words(text_combined, only_words=action_verbs)
-    repetition_ratio = sum([all_reps[w] - 1 for w in all_reps]) / len(text_combined.split()) if text_combined.split() else 0
-    stats = resume_stats(text_combined)
-    contacts = detect_contacts(raw_text)
-    contacts_score = sum(1 for v in contacts.values() if v) / len(contacts) if contacts else 0
+    if resume_data is None:
+        resume_data = parse_resume(resume_file_path, filename=filename)
+    analysis = ResumeAnalysis(resume_data, batch_nlp=batch_nlp)
+
+    job = compile_job(job_title, experience_level)
+    relevant_jds = job.relevant_jds
+
+    print(f"Matched JDs: {len(job.matched_jds)} (by {job.match})")
 
     all_scores = []
     all_skills_matched = []
-    all_action_verbs = []
-    all_buzzwords = []
-    all_project_analysis = []
     all_valid_certs = []
 
-    for jd in relevant_jds:
-        jd_skills = jd.get("Skills", [])
-        skills_match = match_skills(resume_data.get("skills", []), jd_skills)
-        skills_score = skills_match["score_percent"] / 100.0
-        action_verbs_score = min(len(set(action_verbs)) / 10.0, 1.0)
-        buzzwords_score = min(len(buzzwords) / len(jd_skills), 1.0) if jd_skills else 1.0
-        project_score = min(project_analysis["avg_point_score"], 1.0)
-        resume_length_score = bell_curve_length_score(stats["num_words"])
-        education_score = 1.0 if resume_data.get("education") else 0.0
-        certifications_score, valid_certs = evaluate_certifications(resume_data.get("certifications", []), jd_specific_certs=jd_skills)
-        summary_score = 1.0 if resume_data.get("summary") else 0.0
-
-        contextual_score = (project_analysis.get("contextual_matches", 0) / project_analysis.get("num_points", 1)) if project_analysis.get("num_points", 0) else 0.0
-        recency_score = recency_bonus(project_analysis)
-        seniority_score = seniority_match_bonus(jd.get("Title", ""), raw_text)
-        quantified_score = quantified_impact_bonus(project_analysis)
-        formatting_score = formatting_check_bonus(resume_data.get("projects", ""), resume_data.get("achievements", ""), raw_text)
-
-        metrics = {
-            "skills_score": skills_score,
-            "action_verbs_score": action_verbs_score,
-            "buzzwords_score": buzzwords_score,
-            "projects_score": project_score,
-            "education_score": education_score,
-            "certifications_score": certifications_score,
-            "repetition_ratio": repetition_ratio,
-            "resume_length_score": resume_length_score,
-            "summary_score": summary_score,
-            "contextual_score": contextual_score,
-            "recency_score": recency_score,
-            "seniority_score": seniority_score,
-            "quantified_score": quantified_score,
-            "formatting_score": formatting_score,
-            "contacts_score": contacts_score,
-            "projects_present": bool(resume_data.get("projects", "")),
-            "achievements_present": bool(resume_data.get("achievements", "")),
-            "skills_present": bool(resume_data.get("skills", [])),
-            "project_links_present": project_analysis.get("contains_links", False)
-        }
-
-        score = calculate_ats_score(metrics)
-        all_scores.append(score)
+    if vectorized and job.rows is not None:
+        all_scores, all_skills_matched, all_valid_certs = score_jds_vectorized(analysis, job.positions, rows=job.rows)
+    else:
+        for jd in relevant_jds:
+            metrics, skills_match, valid_certs = analysis.jd_metrics(jd)
+            all_scores.append(calculate_ats_score(metrics))
+            all_skills_matched.append(skills_match)
+            all_valid_certs.extend(valid_certs)
 
-        all_skills_matched.append(skills_match)
-        all_action_verbs.extend(action_verbs)
-        all_buzzwords.extend(buzzwords)
-        all_project_analysis.append(project_analysis)
-        all_valid_certs.extend(valid_certs)
+    # TF-IDF cosine of the resume text against every matched JD: one sparse mat-vec
+    text_similarities = []
+    if job.text_rows is not None:
+        text_similarities = [round(sim, 2) for sim in jd_text_model().similarities(resume_text(resume_data), rows=job.text_rows)]
 
     avg_score = round(sum(all_scores) / len(all_scores)) if all_scores else 0
     best_score = max(all_scores) if all_scores else 0
     worst_score = min(all_scores) if all_scores else 0
 
-    suggestions = generate_suggestions(resume_data, jd_skills=jd_skills)
+    # suggestions are built against the last matched JD's skills (original behaviour)
+    suggestions = generate_suggestions(resume_data, jd_skills=relevant_jds[-1].get("Skills", []), analysis=analysis)
 
     result = {
         "ats_score": avg_score,
@@ -480,14 +739,18 @@ def ats_score_verbose(resume_file_path, job_title="", experience_level=""):
         "all_scores": all_scores,
         "resume_data": resume_data,
         "skills_matched": all_skills_matched,
-        "action_verbs": sorted(set(all_action_verbs)),
-        "buzzwords": sorted(set(all_buzzwords)),
-        "repetitions": all_reps,
-        "project_analysis": all_project_analysis,
+        "action_verbs": sorted(set(analysis.action_verbs)),
+        "buzzwords": sorted(set(analysis.buzzwords)),
+        "repetitions": analysis.repetitions,
+        "project_analysis": [analysis.project_analysis] * len(relevant_jds),
         "valid_certifications": sorted(set(all_valid_certs)),
         "education_present": bool(resume_data.get("education")),
         "improvement_suggestions": suggestions,
-        "num_relevant_jds": len(relevant_jds)
+        "num_relevant_jds": len(relevant_jds),
+        "jd_match": job.match,  # "title", "nearest" (no title match; closest JDs used) or "none" (empty fallback JD)
+        # informational, not part of ats_score; None when no JD matched or scikit-learn is missing
+        "text_similarity": round(sum(text_similarities) / len(text_similarities), 2) if text_similarities else None,
+        "all_text_similarities": text_similarities,
     }
     
     print(f"ATS scoring completed. Score: {avg_score}")
@@ -0,0 +1,109 @@
+# python_nlp_service/modules/ats_worker.py
+"""
+Long-lived scoring worker, used two ways:
+  - as a script, by the Express worker pool (backend/utils/pythonWorkerPool.js)
+  - via init_worker/handle_job in a ProcessPoolExecutor, by backend/fastapi_app.py
+
+Loads the parser, scorer, spaCy model and job dataset once, then serves
+line-delimited JSON jobs on stdin:
+    {"id": 1, "type": "score", "file_path": "...", "job_title": "...", "experience_level": "..."}
+    {"id": 2, "type": "parse", "file_path": "...", "max_pages": 2, "max_chars": 20000}  (limits optional)
+    {"id": 3, "type": "roles", "file_path": "...", "top_k": 10}
+    {"id": 4, "type": "ping"}  (answers with the pid and the spaCy load stats)
+(handle_job also accepts "file_bytes" + "filename" instead of "file_path", and
+a cached parse result as "resume_data" on score and roles jobs)
+and answers each with exactly one JSON line on stdout:
+    {"id": 1, "ok": true, "result": {...}}
+    {"id": 1, "ok": false, "error": "...", "traceback": "..."}
+A {"type": "ready"} line is written once the models are loaded.
+"""
+import sys
+import os
+import json
+import traceback
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+_PROTOCOL_OUT = sys.stdout
+
+
+def _send(message):
+    _PROTOCOL_OUT.write(json.dumps(message) + "\n")
+    _PROTOCOL_OUT.flush()
+
+
+def handle_job(job):
+    """Run one job dict and return its result payload (raises on failure)."""
+    from python_nlp_service.modules.ats_scorer import ats_score_verbose, best_fit_roles
+    from python_nlp_service.modules.resume_parser import parse_resume
+
+    job_type = job.get("type", "score")
+    if job_type == "ping":
+        from python_nlp_service.modules.nlp_provider import NLP_PROVIDER
+        return {"pid": os.getpid(), "nlp": NLP_PROVIDER.stats()}
+
+    # in-process callers pass the upload itself; the Express pool passes a path
+    source = job.get("file_bytes")
+    filename = job.get("filename")
+    resume_data = job.get("resume_data")
+    if source is None and resume_data is None:
+        source = job.get("file_path", "")
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"File not found: {source}")
+    if job_type == "parse":
+        return parse_resume(source, filename=filename, max_pages=job.get("max_pages"), max_chars=job.get("max_chars"))
+    if job_type == "score":
+        return ats_score_verbose(
+            source, job.get("job_title", ""), job.get("experience_level", ""),
+            filename=filename, resume_data=resume_data,
+        )
+    if job_type == "roles":
+        return best_fit_roles(source, top_k=job.get("top_k", 10), filename=filename, resume_data=resume_data)
+    raise ValueError(f"Unknown job type: {job_type}")
+
+
+def warm_up():
+    """Import the NLP modules and load the shared spaCy model, which is otherwise loaded on first use."""
+    import python_nlp_service.modules.ats_scorer  # noqa: F401
+    from python_nlp_service.modules import pdf_pages
+    pdf_pages.IN_WORKER_PROCESS = True  # no nested page-parallel pool per scoring worker
+    from python_nlp_service.modules.nlp_provider import NLP_PROVIDER
+    NLP_PROVIDER.get()
+
+
+def init_worker():
+    """ProcessPoolExecutor initializer: warm up once per process."""
+    warm_up()
+
+
+def main():
+    global _PROTOCOL_OUT
+    # stdout is the protocol channel; route the modules' progress prints to stderr
+    _PROTOCOL_OUT = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        # warm up: spaCy model, configs, job dataset + indexes
+        warm_up()
+    except Exception as e:
+        _send({"type": "fatal", "error": f"Import failed: {str(e)}", "traceback": traceback.format_exc()})
+        sys.exit(1)
+    _send({"type": "ready", "pid": os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.get("id")
+            _send({"id": job_id, "ok": True, "result": handle_job(job)})
+        except Exception as e:
+            _send({"id": job_id, "ok": False, "error": str(e), "traceback": traceback.format_exc()})
+
+
+if __name__ == "__main__":
+    main()
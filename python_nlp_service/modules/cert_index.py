@@ -0,0 +1,63 @@
+# python_nlp_service/modules/cert_index.py
+from bisect import bisect_right
+from typing import Iterable, List, Optional
+
+from python_nlp_service.modules.skill_matcher import SkillMatcher
+
+_SEP = "\x00"
+
+
+class CertificationIndex:
+    """
+    Lowercased certifications.json entries, indexed once for:
+      - exact membership (set)
+      - "cert in text": Aho-Corasick automaton without word boundaries
+      - "text in cert": one find() over all certs joined by "\\x00", with bisect
+        mapping the hit offset back to the cert
+    Both containment lookups answer with the earliest cert in list order, like
+    the linear scans they replace. Shared via config_loader.CONFIG.get("cert_index").
+    """
+
+    def __init__(self, certs: Iterable[str]):
+        self.certs: List[str] = [c.lower() for c in certs]
+        self._exact = set(self.certs)
+        self._rank = {}
+        for i, c in enumerate(self.certs):
+            self._rank.setdefault(c, i)
+        # empty entries never matched in the linear scans (`if c and ...`)
+        indexed = [c for c in self._rank if c]
+        self._matcher = SkillMatcher({c: [c] for c in indexed}, word_boundaries=False)
+        self._starts = []
+        pos = 0
+        for c in indexed:
+            self._starts.append(pos)
+            pos += len(c) + len(_SEP)
+        self._indexed = indexed
+        self._joined = _SEP.join(indexed)
+
+    def __len__(self):
+        return len(self.certs)
+
+    def __contains__(self, cert_lower: str) -> bool:
+        return cert_lower in self._exact
+
+    def contained_in(self, text_lower: str) -> Optional[str]:
+        """Earliest cert that is a substring of text_lower."""
+        found = self._matcher.find_canonicals(text_lower)
+        return min(found, key=self._rank.__getitem__) if found else None
+
+    def containing(self, text_lower: str) -> Optional[str]:
+        """Earliest cert that has text_lower as a substring."""
+        if not self._indexed:
+            return None
+        if _SEP in text_lower:  # could straddle two entries in the joined string
+            return next((c for c in self._indexed if text_lower in c), None)
+        hit = self._joined.find(text_lower)
+        if hit < 0:
+            return None
+        return self._indexed[bisect_right(self._starts, hit) - 1]
+
+    def match(self, text_lower: str) -> Optional[str]:
+        """First cert c (list order) with `c in text_lower or text_lower in c`."""
+        candidates = [c for c in (self.contained_in(text_lower), self.containing(text_lower)) if c]
+        return min(candidates, key=self._rank.__getitem__) if candidates else None
@@ -1,8 +1,47 @@
 # python_nlp_service/modules/config_loader.py
+"""
+Shared config registry. Every config asset, raw JSON or a structure derived
+from it, is loaded on first CONFIG.get(name) and kept once per process, so
+resume_parser, ats_scorer and skills_standardizer share the same objects.
+Derived assets marked `snapshot` are also pickled to SNAPSHOT_DIR together with
+the fingerprints of the files they were built from; a fresh worker unpickles
+them instead of rebuilding, and any change to those files rebuilds the snapshot.
+"""
+import gc
 import json
 import os
+import sys
+import time
+import pickle
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable
+
+# optional: cross-process lock so one worker builds a missing snapshot while the others wait (POSIX)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+from python_nlp_service.modules.skill_matcher import SkillMatcher, build_variant_lookup
+from python_nlp_service.modules.cert_index import CertificationIndex
+from python_nlp_service.modules.verb_inflections import ActionVerbTable
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # python_nlp_service/
+CONFIG_DIR = os.path.join(BASE_DIR, "config")
+
+# ------------------ Snapshot settings ------------------
+# bump when the pickled shape of a snapshotted class changes without its module file changing
+SNAPSHOT_VERSION = 1
+# "" disables snapshots (everything is rebuilt from JSON in each process)
+SNAPSHOT_DIR = os.environ.get("CONFIG_SNAPSHOT_DIR", os.path.join(BASE_DIR, ".config_cache"))
+# "mtime": size + mtime_ns of each source (cheap); "hash": sha256 of each source
+SNAPSHOT_VALIDATE = os.environ.get("CONFIG_SNAPSHOT_VALIDATE", "mtime")
 
-CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config")
 
 def load_json(filename):
     path = os.path.join(CONFIG_DIR, filename)
@@ -10,3 +49,197 @@ def load_json(filename):
         raise FileNotFoundError(f"Config file not found: {path}")
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
+
+
+def _fingerprint(relpath: str):
+    """(size, mtime_ns) or sha256 of a file under BASE_DIR; None if it does not exist."""
+    path = os.path.join(BASE_DIR, relpath)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if SNAPSHOT_VALIDATE == "hash":
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    return (st.st_size, st.st_mtime_ns)
+
+
+class ConfigRegistry:
+    """
+    name -> (builder, sources, snapshot). `sources` are paths relative to
+    python_nlp_service/ and must cover everything the builder reads, including
+    the modules defining snapshotted classes, since they key the snapshot.
+    """
+
+    def __init__(self, snapshot_dir: str = SNAPSHOT_DIR):
+        self.snapshot_dir = snapshot_dir
+        self._assets: Dict[str, tuple] = {}
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.RLock()  # builders call get() for their inputs
+        self.load_info: Dict[str, Dict] = {}  # name -> {"from": "json"|"built"|"snapshot", "ms": ...}
+
+    def register(self, name: str, builder: Callable[[], Any], sources: Iterable[str] = (), snapshot: bool = False):
+        self._assets[name] = (builder, tuple(sources), snapshot)
+
+    def get(self, name: str) -> Any:
+        """Load (or build) the asset on first use; errors from the builder propagate and nothing is cached."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._values:
+                self._values[name] = self._load(name)
+            return self._values[name]
+
+    def loaded(self) -> Dict[str, Dict]:
+        return dict(self.load_info)
+
+    def _load(self, name: str) -> Any:
+        builder, sources, snapshot = self._assets[name]
+        t0 = time.perf_counter()
+        key = None
+        origin = "built" if snapshot else "json"
+        if not (snapshot and self.snapshot_dir):
+            value = builder()
+            self.load_info[name] = {"from": origin, "ms": round((time.perf_counter() - t0) * 1000, 1)}
+            return value
+        key = (SNAPSHOT_VERSION, sys.version_info[:2], tuple((s, _fingerprint(s)) for s in sources))
+        found, value = self._read_snapshot(name, key)
+        if not found:
+            with self._build_lock(name):
+                # a worker that held the lock before this one has usually just written it
+                found, value = self._read_snapshot(name, key)
+                if not found:
+                    value = builder()
+                    self._write_snapshot(name, key, value)
+        self.load_info[name] = {"from": "snapshot" if found else origin, "ms": round((time.perf_counter() - t0) * 1000, 1)}
+        return value
+
+    @contextmanager
+    def _build_lock(self, name: str):
+        """Exclusive lock on <snapshot_dir>/.<name>.lock; a no-op where it cannot be taken."""
+        f = None
+        if FCNTL_AVAILABLE:
+            try:
+                os.makedirs(self.snapshot_dir, exist_ok=True)
+                f = open(os.path.join(self.snapshot_dir, f".{name}.lock"), "a")
+                fcntl.flock(f, fcntl.LOCK_EX)
+            except OSError:
+                if f is not None:
+                    f.close()
+                f = None
+        try:
+            yield
+        finally:
+            if f is not None:
+                f.close()  # releases the lock
+
+    def _snapshot_path(self, name: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{name}.pickle")
+
+    def _read_snapshot(self, name: str, key):
+        try:
+            with open(self._snapshot_path(name), "rb") as f:
+                if pickle.load(f) != key:  # header first: stale snapshots are never unpickled in full
+                    return False, None
+                # tens of thousands of small dicts/lists: collection passes mid-load only cost time
+                was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    return True, pickle.load(f)
+                finally:
+                    if was_enabled:
+                        gc.enable()
+        except Exception:
+            return False, None
+
+    def _write_snapshot(self, name: str, key, value):
+        tmp = None
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.snapshot_dir, prefix=f".{name}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp, 0o644)  # mkstemp creates 0600; workers may run as another user
+            os.replace(tmp, self._snapshot_path(name))  # atomic: concurrent workers see old or new, never partial
+        except Exception as e:
+            print(f"⚠️ Could not write config snapshot '{name}': {e}")
+            if tmp and os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+# ------------------ Assets ------------------
+CONFIG = ConfigRegistry()
+
+_SKILLS_MAP = "config/skills_map_final.json"
+_SYNONYMS = "config/synonym_skills.json"
+_CERTS = "config/certifications.json"
+_INFLECTIONS = "config/action_verb_inflections.json"
+_JOB_DATASET = "datasets/job_descriptions/job_dataset.json"
+
+
+def _cert_index() -> CertificationIndex:
+    # a missing/broken certifications.json gives an empty index
+    try:
+        certs = load_json("certifications.json")
+    except Exception:
+        certs = []
+    return CertificationIndex(certs)
+
+
+def _jd_text_model():
+    # raise rather than return None: a None snapshot would outlive installing scikit-learn
+    from python_nlp_service.modules.similarity_scorer import SKLEARN_AVAILABLE, JDTextModel
+    if not SKLEARN_AVAILABLE:
+        raise ImportError("scikit-learn is required for the JD text model")
+    with open(os.path.join(BASE_DIR, _JOB_DATASET), "r", encoding="utf-8") as f:
+        return JDTextModel(json.load(f))
+
+
+def _jd_neighbours():
+    from python_nlp_service.modules.jd_index import NearestJDIndex
+    with open(os.path.join(BASE_DIR, _JOB_DATASET), "r", encoding="utf-8") as f:
+        return NearestJDIndex(json.load(f))
+
+
+def _action_verb_table() -> ActionVerbTable:
+    inflections = CONFIG.get("action_verb_inflections")
+    return ActionVerbTable(
+        [v.lower() for v in CONFIG.get("action_verbs")],
+        inflections.get("irregular", {}),
+        inflections.get("ambiguous", []),
+    )
+
+
+CONFIG.register("skills_map", lambda: load_json("skills_map_final.json"), [_SKILLS_MAP])
+CONFIG.register("skill_synonyms", lambda: load_json("synonym_skills.json"), [_SYNONYMS])
+CONFIG.register("action_verbs", lambda: load_json("action_verbs.json"), ["config/action_verbs.json"])
+CONFIG.register("action_verb_inflections", lambda: load_json("action_verb_inflections.json"), [_INFLECTIONS])
+CONFIG.register("action_verb_table", _action_verb_table, ["config/action_verbs.json", _INFLECTIONS])
+CONFIG.register("skill_names", lambda: set(CONFIG.get("skills_map")), [_SKILLS_MAP])
+CONFIG.register("skill_lookup", lambda: build_variant_lookup(CONFIG.get("skill_synonyms")), [_SYNONYMS])
+CONFIG.register(
+    "skill_matcher",
+    lambda: SkillMatcher.from_config(CONFIG.get("skill_synonyms"), CONFIG.get("skills_map")),
+    [_SYNONYMS, _SKILLS_MAP, "modules/skill_matcher.py"],
+    snapshot=True,
+)
+CONFIG.register(
+    "cert_index", _cert_index,
+    [_CERTS, "modules/cert_index.py", "modules/skill_matcher.py"],
+    snapshot=True,
+)
+# TF-IDF fitted on the whole JD corpus; fit it ahead of deploys with scripts/fit_jd_text_model.py
+CONFIG.register(
+    "jd_text_model", _jd_text_model,
+    [_JOB_DATASET, "modules/similarity_scorer.py"],
+    snapshot=True,
+)
+# char n-gram index for titles the title/level filter does not match (ats_scorer.compile_job)
+CONFIG.register(
+    "jd_neighbours", _jd_neighbours,
+    [_JOB_DATASET, "modules/jd_index.py"],
+    snapshot=True,
+)
@@ -0,0 +1,72 @@
+# python_nlp_service/modules/fuzzy_matcher.py
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable
+
+FUZZY_THRESHOLD = 0.75
+
+
+@lru_cache(maxsize=65536)
+def fuzzy_pair_match(a_lower: str, b_lower: str, threshold: float = FUZZY_THRESHOLD) -> bool:
+    """Process-wide cached SequenceMatcher decision for one (JD skill, resume skill) pair."""
+    return SequenceMatcher(None, a_lower, b_lower).ratio() > threshold
+
+
+class FuzzySkillIndex:
+    """
+    Index over one resume's (normalized) skills, built once per request.
+
+    matches(jd_skill) gives the same answer as
+        any(jd_skill.lower() == rs.lower() or SequenceMatcher(None, jd_skill.lower(), rs.lower()).ratio() > 0.75
+            for rs in resume_skills)
+    but only runs SequenceMatcher on candidates that can still pass. SequenceMatcher's
+    ratio is 2*M/T with M bounded by the shared character counts (its quick_ratio), so:
+      - the length window 2*min(la, lb)/(la + lb) > threshold prunes by length, and
+      - the shared-character count prunes the rest,
+    both of which are exact upper bounds, so no true match is ever filtered out.
+    Decisions are memoized per JD skill for the lifetime of the index.
+    """
+
+    def __init__(self, resume_skills: Iterable[str], threshold: float = FUZZY_THRESHOLD):
+        self.threshold = threshold
+        self._exact = set()
+        self._by_len = defaultdict(list)  # length -> [(skill_lower, char counts)]
+        for skill in resume_skills:
+            s = skill.lower()
+            if s not in self._exact:
+                self._exact.add(s)
+                self._by_len[len(s)].append((s, Counter(s)))
+        self._lengths = sorted(self._by_len)
+        self._decisions = {}
+
+    def __len__(self):
+        return len(self._exact)
+
+    def matches(self, jd_skill: str) -> bool:
+        a = jd_skill.lower()
+        decision = self._decisions.get(a)
+        if decision is None:
+            decision = self._decisions[a] = self._matches(a)
+        return decision
+
+    def _matches(self, a: str) -> bool:
+        if a in self._exact:
+            return True
+        la = len(a)
+        a_counts = None
+        t = self.threshold
+        for lb in self._lengths:
+            total = la + lb
+            if not total or 2.0 * min(la, lb) / total <= t:
+                continue
+            if a_counts is None:
+                a_counts = Counter(a)
+            for b, b_counts in self._by_len[lb]:
+                small, large = (a_counts, b_counts) if len(a_counts) <= len(b_counts) else (b_counts, a_counts)
+                shared = sum(min(n, large[ch]) for ch, n in small.items() if ch in large)
+                if 2.0 * shared / total <= t:
+                    continue
+                if fuzzy_pair_match(a, b, t):
+                    return True
+        return False
@@ -0,0 +1,238 @@
+# python_nlp_service/modules/jd_index.py
+import re
+import math
+import heapq
+from collections import defaultdict
+from typing import Callable, Dict, List, Set, Tuple
+
+
+def normalize_text(s):
+    """
+    Normalize text for loose matching:
+    - lowercase
+    - remove spaces, hyphens, symbols
+    """
+    return re.sub(r'[^a-z0-9]', '', (s or '').lower())
+
+
+class _SubstringIndex:
+    """
+    Character n-gram index over a set of distinct keys.
+    keys_containing(q) returns every key k with q in k, touching only
+    the posting lists of q's grams instead of scanning all keys.
+    """
+
+    def __init__(self, keys, n=3):
+        self.n = n
+        self.keys: Set[str] = set(keys)
+        self._grams: Dict[str, Set[str]] = defaultdict(set)
+        for key in self.keys:
+            # every gram of length 1..n, so short queries are a direct lookup
+            for size in range(1, n + 1):
+                for i in range(len(key) - size + 1):
+                    self._grams[key[i:i + size]].add(key)
+
+    def keys_containing(self, q: str) -> Set[str]:
+        if not q:
+            return self.keys
+        if len(q) <= self.n:
+            return self._grams.get(q, set())
+        postings = []
+        for i in range(len(q) - self.n + 1):
+            posting = self._grams.get(q[i:i + self.n])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        return {k for k in candidates if q in k}
+
+
+class JobIndex:
+    """
+    Load-time index over JOB_DATASET for the title / experience-level filter.
+
+    lookup(title, level) returns exactly the JDs (same objects, dataset order) as
+        [jd for jd in dataset
+         if normalize_text(title) in normalize_text(jd["Title"])
+         and normalize_text(level) in normalize_text(jd["ExperienceLevel"])]
+    but only visits distinct normalized titles/levels that share the query's grams.
+    """
+
+    def __init__(self, dataset: List[Dict], n=3):
+        self.dataset = dataset
+        # normalized title -> normalized level -> dataset positions
+        self._positions: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        levels = set()
+        for pos, jd in enumerate(dataset):
+            title = normalize_text(jd.get("Title", ""))
+            level = normalize_text(jd.get("ExperienceLevel", ""))
+            self._positions[title][level].append(pos)
+            levels.add(level)
+        self._positions = {title: dict(by_level) for title, by_level in self._positions.items()}
+        self._titles = _SubstringIndex(self._positions.keys(), n=n)
+        self._levels = _SubstringIndex(levels, n=n)
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def lookup_positions(self, job_title="", experience_level="") -> List[int]:
+        titles = self._titles.keys_containing(normalize_text(job_title))
+        if not titles:
+            return []
+        levels = self._levels.keys_containing(normalize_text(experience_level))
+        positions = []
+        for title in titles:
+            by_level = self._positions[title]
+            if len(by_level) <= len(levels):
+                for level, pos in by_level.items():
+                    if level in levels:
+                        positions.extend(pos)
+            else:
+                for level in levels:
+                    if level in by_level:
+                        positions.extend(by_level[level])
+        positions.sort()
+        return positions
+
+    def lookup(self, job_title="", experience_level="") -> List[Dict]:
+        return [self.dataset[pos] for pos in self.lookup_positions(job_title, experience_level)]
+
+
+def _char_grams(text: str, n: int = 3) -> Dict[str, int]:
+    """Counts of the character n-grams of each word padded with spaces ("dev" -> " de", "dev", "ev ")."""
+    counts: Dict[str, int] = defaultdict(int)
+    for word in re.findall(r'[a-z0-9+#]+', (text or '').lower()):
+        padded = f" {word} "
+        for i in range(max(len(padded) - n + 1, 1)):
+            counts[padded[i:i + n]] += 1
+    return counts
+
+
+def _words(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = defaultdict(int)
+    for word in re.findall(r'[a-z0-9+#]+', (text or '').lower()):
+        counts[word] += 1
+    return counts
+
+
+class _TfidfIndex:
+    """
+    TF-IDF over a list of texts (terms from `analyzer`), stored as posting lists
+    (term -> [(doc id, weight)]) of L2-normalized document vectors.
+    cosine(q) returns {doc id: cosine similarity} touching only the postings of
+    q's terms; terms in more than max_df of the documents are dropped (low IDF,
+    long postings).
+    """
+
+    def __init__(self, texts: List[str], analyzer: Callable[[str], Dict[str, int]], max_df=0.5):
+        self.analyzer = analyzer
+        terms = [analyzer(t) for t in texts]
+        df: Dict[str, int] = defaultdict(int)
+        for counts in terms:
+            for term in counts:
+                df[term] += 1
+        limit = max(max_df * len(texts), 1)
+        self.idf = {t: math.log((1 + len(texts)) / (1 + d)) + 1 for t, d in df.items() if d <= limit}
+        self._postings: Dict[str, List] = defaultdict(list)
+        for doc, counts in enumerate(terms):
+            weights = self._weights(counts)
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            for term, w in weights.items():
+                self._postings[term].append((doc, w / norm))
+        self._postings = dict(self._postings)
+
+    def _weights(self, counts):
+        return {t: c * self.idf[t] for t, c in counts.items() if t in self.idf}
+
+    def cosine(self, text: str) -> Dict[int, float]:
+        weights = self._weights(self.analyzer(text))
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        scores: Dict[int, float] = defaultdict(float)
+        for term, w in weights.items():
+            for doc, dw in self._postings[term]:
+                scores[doc] += w / norm * dw
+        return scores
+
+
+class NearestJDIndex:
+    """
+    Fallback for titles JobIndex.lookup does not match: the k JDs whose title
+    and description (Keywords + Responsibilities) are closest to the query, so
+    "Backend Developer" still scores against the "Backend Engineer" JDs instead
+    of an empty stub.
+
+    similarity(jd) = title_weight * cos(query, title) + (1 - title_weight) * cos(query, description)
+    Titles use character 3-gram TF-IDF ("Front End" ~ "Frontend", "Dev" ~ "Developer"),
+    descriptions word TF-IDF. Both are indexed once per distinct text, and a query
+    reads the postings of its own terms plus at most k JDs per similar title, never
+    every JD. JDs whose experience level matches experience_level (same substring
+    rule as JobIndex) are preferred when there are any.
+    """
+
+    def __init__(self, dataset: List[Dict], title_weight=0.7):
+        self.dataset = dataset
+        self.title_weight = title_weight
+        titles: Dict[str, int] = {}
+        descriptions: Dict[str, int] = {}
+        self._title_positions: List[List[int]] = []
+        self._description_positions: List[List[int]] = []
+        self._title_of: List[int] = []
+        for pos, jd in enumerate(dataset):
+            tid = titles.setdefault(jd.get("Title", "") or "", len(titles))
+            did = descriptions.setdefault(self._description(jd), len(descriptions))
+            if tid == len(self._title_positions):
+                self._title_positions.append([])
+            if did == len(self._description_positions):
+                self._description_positions.append([])
+            self._title_positions[tid].append(pos)
+            self._description_positions[did].append(pos)
+            self._title_of.append(tid)
+        self._titles = _TfidfIndex(list(titles), _char_grams)
+        self._descriptions = _TfidfIndex(list(descriptions), _words)
+        self._levels = [normalize_text(jd.get("ExperienceLevel", "")) for jd in dataset]
+
+    @staticmethod
+    def _description(jd: Dict) -> str:
+        keywords = jd.get("Keywords", []) or []
+        return " ".join([" ".join(map(str, keywords)), str(jd.get("Responsibilities", "") or "")])
+
+    def __len__(self):
+        return len(self.dataset)
+
+    def nearest_positions(self, job_title="", experience_level="", k=25, min_similarity=0.3) -> List[Tuple[int, float]]:
+        """[(dataset position, similarity)] of the k closest JDs, best first; [] if none reaches min_similarity."""
+        title_sims = {tid: self.title_weight * sim for tid, sim in self._titles.cosine(job_title).items()}
+        # JDs with description hits get both terms; every other JD only its title's
+        scored: Dict[int, float] = {}
+        for did, sim in self._descriptions.cosine(job_title).items():
+            for pos in self._description_positions[did]:
+                scored[pos] = title_sims.get(self._title_of[pos], 0.0) + (1 - self.title_weight) * sim
+        groups = sorted(((sim, tid) for tid, sim in title_sims.items() if sim >= min_similarity), key=lambda g: (-g[0], g[1]))
+
+        level = normalize_text(experience_level)
+        for wanted_level in ([level, ""] if level else [""]):
+            accept = lambda pos: wanted_level in self._levels[pos]
+            candidates = [(pos, sim) for pos, sim in scored.items() if sim >= min_similarity and accept(pos)]
+            title_only = 0
+            # groups come best first: once k title-only JDs are in, only groups tied
+            # with the last one can still reach the top k (lower positions win ties)
+            for sim, tid in groups:
+                if title_only >= k and sim < floor:
+                    break
+                taken = 0
+                for pos in self._title_positions[tid]:
+                    if pos not in scored and accept(pos):
+                        candidates.append((pos, sim))
+                        taken += 1
+                        if taken >= k:
+                            break
+                title_only += taken
+                floor = sim
+            if candidates:
+                return heapq.nsmallest(k, candidates, key=lambda item: (-item[1], item[0]))
+        return []
@@ -0,0 +1,113 @@
+# python_nlp_service/modules/jd_matrix.py
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class JDSkillMatrix:
+    """
+    Sparse (CSR) encoding of every JD's skill list, built once at load time.
+
+    Two vocabularies are kept because the scorer compares JD skills in two ways:
+      - skill ids: normalize_skill(skill), as used by match_skills
+      - cert ids:  skill.lower(), as used by evaluate_certifications
+    Rows are deduplicated per JD; `lengths` keeps the raw len(jd["Skills"]),
+    which is the denominator every per-JD ratio uses.
+    """
+
+    def __init__(self, dataset: List[Dict], normalize: Callable[[str], str]):
+        self.skill_vocab: List[str] = []
+        self.cert_vocab: List[str] = []
+        self.titles: List[str] = []
+        skill_ids: Dict[str, int] = {}
+        cert_ids: Dict[str, int] = {}
+        title_ids: Dict[str, int] = {}
+        normalized: Dict[str, str] = {}  # distinct raw skills are far fewer than JDs
+
+        skill_indptr, skill_indices = [0], []
+        cert_indptr, cert_indices = [0], []
+        lengths, row_titles = [], []
+        for jd in dataset:
+            raw_skills = jd.get("Skills", []) or []
+            row_skills, row_certs = set(), set()
+            for raw in raw_skills:
+                norm = normalized.get(raw)
+                if norm is None:
+                    norm = normalized[raw] = normalize(raw)
+                if norm not in skill_ids:
+                    skill_ids[norm] = len(self.skill_vocab)
+                    self.skill_vocab.append(norm)
+                row_skills.add(skill_ids[norm])
+                low = raw.lower()
+                if low not in cert_ids:
+                    cert_ids[low] = len(self.cert_vocab)
+                    self.cert_vocab.append(low)
+                row_certs.add(cert_ids[low])
+            skill_indices.extend(sorted(row_skills))
+            skill_indptr.append(len(skill_indices))
+            cert_indices.extend(sorted(row_certs))
+            cert_indptr.append(len(cert_indices))
+            lengths.append(len(raw_skills))
+
+            title = jd.get("Title", "")
+            if title not in title_ids:
+                title_ids[title] = len(self.titles)
+                self.titles.append(title)
+            row_titles.append(title_ids[title])
+
+        self.skill_indptr = np.asarray(skill_indptr, dtype=np.int64)
+        self.skill_indices = np.asarray(skill_indices, dtype=np.int64)
+        self.cert_indptr = np.asarray(cert_indptr, dtype=np.int64)
+        self.cert_indices = np.asarray(cert_indices, dtype=np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.title_ids = np.asarray(row_titles, dtype=np.int64)
+        self.cert_id_of = cert_ids
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def skill_rows(self, positions):
+        """(flat skill ids, row offsets) for the given dataset positions."""
+        return _gather_rows(self.skill_indptr, self.skill_indices, positions)
+
+    def cert_rows(self, positions):
+        """(flat cert ids, row offsets) for the given dataset positions."""
+        return _gather_rows(self.cert_indptr, self.cert_indices, positions)
+
+
+class JDRows:
+    """
+    The JD-side arrays score_jds_vectorized needs for one set of dataset positions.
+    They depend only on the job filter, so a CompiledJob builds them once and every
+    resume scored against that job reuses them.
+    """
+
+    def __init__(self, matrix: JDSkillMatrix, positions):
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.lengths = matrix.lengths[self.positions]
+        self.has_skills = self.lengths > 0
+        self.safe_lengths = np.where(self.has_skills, self.lengths, 1)
+        self.skill_flat, self.skill_offsets = matrix.skill_rows(self.positions)
+        self.skill_ids = np.unique(self.skill_flat)  # each distinct JD skill is matched once per resume
+        self.cert_flat, self.cert_offsets = matrix.cert_rows(self.positions)
+        self.title_ids, self.title_inverse = np.unique(matrix.title_ids[self.positions], return_inverse=True)
+
+    def __len__(self):
+        return len(self.positions)
+
+
+def _gather_rows(indptr, indices, positions):
+    starts = indptr[positions]
+    lens = indptr[positions + 1] - starts
+    offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+    np.cumsum(lens, out=offsets[1:])
+    # flat index of every element of every selected row, without a Python loop
+    flat = np.repeat(starts - offsets[:-1], lens) + np.arange(offsets[-1], dtype=np.int64)
+    return indices[flat], offsets
+
+
+def row_sums(values, offsets):
+    """Per-row sums of `values` laid out by `offsets` (empty rows give 0)."""
+    csum = np.zeros(len(values) + 1, dtype=np.float64)
+    np.cumsum(values, out=csum[1:])
+    return csum[offsets[1:]] - csum[offsets[:-1]]
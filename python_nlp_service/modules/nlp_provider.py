@@ -0,0 +1,123 @@
+# python_nlp_service/modules/nlp_provider.py
+"""
+One spaCy pipeline per process, loaded on first use and shared by every caller.
+
+Callers take a view naming the components they need:
+    NER = NLP_PROVIDER.view("ner")
+    doc = NER(text)
+and the view runs the shared pipeline with every other component disabled
+(components they listen to, e.g. a shared tok2vec, are kept automatically).
+"""
+import os
+import time
+import threading
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import resource  # not on Windows; memory is then reported as None
+except ImportError:
+    resource = None
+
+MODEL_NAME = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+class NLPProvider:
+    """Lazily loads `model_name` once (thread-safe); a failed load is remembered and reported."""
+
+    def __init__(self, model_name: str = MODEL_NAME):
+        self.model_name = model_name
+        self._nlp = None
+        self._attempted = False
+        self._error = None
+        self._load_ms = None
+        self._rss_delta_mb = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """The shared Language object, or None if spaCy / the model is unavailable."""
+        if not self._attempted:
+            with self._lock:
+                if not self._attempted:
+                    self._load()
+        return self._nlp
+
+    def _load(self):
+        rss_before = _max_rss_mb()
+        t0 = time.perf_counter()
+        try:
+            import spacy
+            self._nlp = spacy.load(self.model_name)
+            self._load_ms = round((time.perf_counter() - t0) * 1000, 1)
+            if rss_before is not None:
+                # peak-RSS growth: an upper bound on what the model keeps resident
+                self._rss_delta_mb = round(_max_rss_mb() - rss_before, 1)
+            print(f"✅ spaCy model '{self.model_name}' loaded in {self._load_ms} ms "
+                  f"(+{self._rss_delta_mb} MiB peak RSS)")
+        except OSError as e:
+            self._error = str(e)
+            print(f"❌ Warning: spaCy model '{self.model_name}' not found. "
+                  f"Please run: python -m spacy download {self.model_name}")
+        except Exception as e:
+            self._error = str(e)
+            print(f"❌ Warning: Could not load spaCy model: {e}")
+        finally:
+            self._attempted = True
+
+    def view(self, *components: str) -> "NLPView":
+        return NLPView(self, components)
+
+    def stats(self) -> Dict:
+        """Load state for health/ping output; never triggers a load."""
+        return {
+            "model": self.model_name,
+            "loaded": self._nlp is not None,
+            "load_ms": self._load_ms,
+            "rss_delta_mb": self._rss_delta_mb,
+            "pipe_names": list(self._nlp.pipe_names) if self._nlp is not None else [],
+            "error": self._error,
+        }
+
+
+class NLPView:
+    """The shared pipeline restricted to `components` (names missing from the model are ignored)."""
+
+    def __init__(self, provider: NLPProvider, components: Iterable[str]):
+        self.provider = provider
+        self.components = tuple(components)
+        self._disable = None
+
+    @property
+    def available(self) -> bool:
+        return self.provider.get() is not None
+
+    @property
+    def disabled(self) -> List[str]:
+        """Pipeline components switched off for this view (computed once, after load)."""
+        if self._disable is None:
+            nlp = self.provider.get()
+            if nlp is None:
+                return []
+            needed = set(self.components)
+            for name, proc in nlp.pipeline:
+                # e.g. tok2vec: keep it when a needed component reads its output
+                listeners = getattr(proc, "listening_components", None) or []
+                if any(listener in needed for listener in listeners):
+                    needed.add(name)
+            self._disable = [name for name in nlp.pipe_names if name not in needed]
+        return self._disable
+
+    def __call__(self, text: str):
+        return self.provider.get()(text, disable=self.disabled)
+
+    def pipe(self, texts: Iterable[str], batch_size: int = 64):
+        return self.provider.get().pipe(texts, disable=self.disabled, batch_size=batch_size)
+
+
+# shared by resume_parser and ats_scorer
+NLP_PROVIDER = NLPProvider()
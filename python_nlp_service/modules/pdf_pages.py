@@ -0,0 +1,209 @@
+# python_nlp_service/modules/pdf_pages.py
+"""
+Per-page PDF extraction (blocks, page text, image metadata) used by
+resume_parser.extract_pdf_data, sequentially or split across worker processes.
+Kept free of the NLP imports so pool workers start with just PyMuPDF loaded.
+"""
+import os
+import multiprocessing
+from array import array
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+import fitz  # PyMuPDF
+
+# ------------------ Parallel settings ------------------
+# documents with at least this many pages are split across processes (0 = never, the
+# default: no crossover has been measured yet). Set it from the crossover that
+# python_nlp_service/scripts/bench_pdf_parallel.py reports on the deployment box.
+PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "0"))
+PARALLEL_WORKERS = int(os.environ.get("PDF_PARALLEL_WORKERS", str(min(4, os.cpu_count() or 1))))
+# set by ats_worker.warm_up: scoring workers already run one per core, so they extract serially
+IN_WORKER_PROCESS = False
+
+# extension Document.extract_image reports: the stream is passed through for JPEG/JPX, re-encoded as PNG otherwise
+_IMAGE_EXT_BY_FILTER = {"DCTDecode": "jpeg", "JPXDecode": "jpx"}
+
+
+class BlockStore:
+    """
+    Text blocks as columns: page numbers and coordinates in typed arrays
+    (MuPDF rects are single precision, so 'f' is lossless), texts in a list.
+    to_dicts() gives the [{page, x0, y0, x1, y1, text}, ...] JSON shape.
+    """
+    __slots__ = ("page", "x0", "y0", "x1", "y1", "text")
+
+    def __init__(self):
+        self.page = array("I")
+        self.x0 = array("f")
+        self.y0 = array("f")
+        self.x1 = array("f")
+        self.y1 = array("f")
+        self.text = []
+
+    def __len__(self):
+        return len(self.text)
+
+    def __eq__(self, other):
+        if not isinstance(other, BlockStore):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def append(self, page: int, x0: float, y0: float, x1: float, y1: float, text: str):
+        self.page.append(page)
+        self.x0.append(x0)
+        self.y0.append(y0)
+        self.x1.append(x1)
+        self.y1.append(y1)
+        self.text.append(text)
+
+    def extend(self, other: "BlockStore"):
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def to_dicts(self) -> List[Dict]:
+        return [
+            {"page": p, "x0": x0, "y0": y0, "x1": x1, "y1": y1, "text": t}
+            for p, x0, y0, x1, y1, t in zip(self.page, self.x0, self.y0, self.x1, self.y1, self.text)
+        ]
+
+
+PageData = Tuple[BlockStore, List[str], List[Dict]]  # (blocks, pages_text, images)
+
+
+def open_pdf(src):
+    """src: a path or the PDF bytes."""
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        return fitz.open(stream=bytes(src), filetype="pdf")
+    return fitz.open(src)
+
+
+def _image_meta(img: tuple, cache: Dict[int, Dict]) -> Dict:
+    """
+    Metadata for one page.get_images(full=True) entry
+    (xref, smask, width, height, bpc, colorspace, alt_colorspace, name, filter, ...),
+    matching the ext/width/height that doc.extract_image(xref) would return.
+    """
+    xref = img[0]
+    meta = cache.get(xref)
+    if meta is None:
+        meta = {"xref": xref, "ext": _IMAGE_EXT_BY_FILTER.get(img[8], "png"), "width": img[2], "height": img[3]}
+        cache[xref] = meta
+    return meta
+
+
+def iter_pages(doc, start: int = 0, stop: int = None) -> Iterator[Tuple[int, BlockStore, str, List[Dict]]]:
+    """
+    Lazily yield (page_index, blocks, page_text, images) for pages [start, stop);
+    each fitz Page is released before the next one is loaded, so callers that
+    stop early never touch the rest of the document.
+    """
+    image_meta_by_xref = {}  # logos/icons reused on every page are resolved once
+
+    for pno in range(start, len(doc) if stop is None else stop):
+        page = doc[pno]
+        page_blocks = BlockStore()
+        try:
+            blocks = page.get_text("blocks")
+        except Exception:
+            blocks = []
+
+        # Sort blocks (tolerant to floats + rounding noise)
+        if blocks:
+            blocks_sorted = sorted(blocks, key=lambda b: (round(b[1], 1), round(b[0], 1)))
+            page_text_parts = []
+            for b in blocks_sorted:
+                txt = b[4] if len(b) > 4 else ""
+                if isinstance(txt, str) and txt.strip():
+                    page_text_parts.append(txt.strip())
+                page_blocks.append(pno + 1, b[0], b[1], b[2], b[3], txt.strip() if isinstance(txt, str) else str(txt))
+            page_text = "\n".join(page_text_parts).strip()
+        else:
+            # fallback plain text
+            try:
+                page_text = (page.get_text("text") or "").strip()
+            except Exception:
+                page_text = ""
+
+        # images metadata: read from the xref dictionaries, never decode the pixels
+        page_images = []
+        try:
+            for img in page.get_images(full=True):
+                page_images.append({"page": pno + 1, **_image_meta(img, image_meta_by_xref)})
+        except Exception:
+            pass
+
+        del page
+        yield pno, page_blocks, page_text, page_images
+
+
+def extract_page_range(doc, start: int, stop: int) -> PageData:
+    """Blocks, text and image metadata for pages [start, stop) of an open document."""
+    blocks_all = BlockStore()
+    pages_text = []
+    images_meta = []
+    for _, blocks, page_text, images in iter_pages(doc, start, stop):
+        blocks_all.extend(blocks)
+        pages_text.append(page_text)
+        images_meta.extend(images)
+    return blocks_all, pages_text, images_meta
+
+
+def use_parallel(page_count: int) -> bool:
+    """
+    Default mode choice: long documents only, with more than one worker, and never
+    inside a scoring worker (FastAPI pool or Express pool process), where a nested
+    pool per worker would oversubscribe the CPUs.
+    """
+    return not IN_WORKER_PROCESS and PARALLEL_WORKERS > 1 and 0 < PARALLEL_MIN_PAGES <= page_count
+
+
+# ------------------ Process pool ------------------
+_POOL = None
+
+
+def _extract_chunk(src, start: int, stop: int) -> PageData:
+    """Pool task: each worker opens its own fitz handle on the path/bytes."""
+    with open_pdf(src) as doc:
+        return extract_page_range(doc, start, stop)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        # spawn: never fork a process that may hold MuPDF state or server threads
+        _POOL = ProcessPoolExecutor(max_workers=PARALLEL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        # shut down before multiprocessing joins child processes at exit, and ahead of the
+        # executor's own queue finalizers (priority 10): an idle pool would otherwise block
+        # the exit of a FastAPI pool worker that used it
+        Finalize(_POOL, _POOL.shutdown, kwargs={"cancel_futures": True}, exitpriority=100)
+    return _POOL
+
+
+def page_chunks(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Split [0, page_count) into `parts` contiguous, near-equal ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    chunks, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        chunks.append((start, stop))
+        start = stop
+    return chunks
+
+
+def extract_pages_parallel(src, page_count: int, workers: int = None) -> PageData:
+    """Extract contiguous page ranges in worker processes and merge them back in page order."""
+    if isinstance(src, (bytearray, memoryview)):
+        src = bytes(src)  # picklable, and shared by every task
+    pool = _get_pool()
+    futures = [pool.submit(_extract_chunk, src, start, stop)
+               for start, stop in page_chunks(page_count, workers or PARALLEL_WORKERS)]
+    blocks_all, pages_text, images_meta = BlockStore(), [], []
+    for future in futures:  # submission order == page order
+        blocks, texts, images = future.result()
+        blocks_all.extend(blocks)
+        pages_text.extend(texts)
+        images_meta.extend(images)
+    return blocks_all, pages_text, images_meta
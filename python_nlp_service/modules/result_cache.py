@@ -0,0 +1,131 @@
+# python_nlp_service/modules/result_cache.py
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent  # python_nlp_service/
+
+# bump when parse_resume / ats_score_verbose output changes for the same input
+# 2: text_similarity / all_text_similarities fields, nearest-JD fallback (jd_match) for unmatched titles
+RESULT_SCHEMA_VERSION = "2"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def config_version() -> str:
+    """
+    Fingerprint of everything a cached result depends on besides the file itself:
+    the schema version, every config JSON (by content) and the job dataset (by size/mtime).
+    """
+    h = hashlib.sha256(RESULT_SCHEMA_VERSION.encode())
+    for path in sorted((BASE_DIR / "config").glob("*.json")):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    dataset = BASE_DIR / "datasets/job_descriptions/job_dataset.json"
+    if dataset.exists():
+        st = dataset.stat()
+        h.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    In-process LRU with an entry limit and TTL, plus an optional SQLite tier
+    shared across workers/restarts. Values must be JSON-serializable.
+    The SQLite tier keeps at most max_disk_entries rows per cache name (the
+    least recently written go first); expired and surplus rows are purged every
+    CLEANUP_EVERY writes, so it can briefly exceed the bound by that many.
+    get/set block on SQLite: async callers should run them in a thread.
+    """
+
+    CLEANUP_EVERY = 128
+
+    def __init__(self, name, max_entries=256, ttl_seconds=3600, sqlite_path=None, max_disk_entries=100000):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(str(sqlite_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "name TEXT, key TEXT, value TEXT, expires_at REAL, PRIMARY KEY (name, key))"
+            )
+            # expiry purge and the size bound both walk rows of one name by expires_at
+            self._db.execute("CREATE INDEX IF NOT EXISTS result_cache_expiry ON result_cache (name, expires_at)")
+            self._purge()
+            self._db.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM result_cache WHERE name = ? AND key = ?", (self.name, key)
+                ).fetchone()
+                if row and row[1] > now:
+                    value = json.loads(row[0])
+                    self._store(key, value, row[1])
+                    self.disk_hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO result_cache (name, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.name, key, json.dumps(value), expires_at),
+                )
+                self._writes += 1
+                if self._writes % self.CLEANUP_EVERY == 0:
+                    self._purge()
+                self._db.commit()
+
+    def _purge(self):
+        """Drop this cache's expired rows, then its oldest rows beyond max_disk_entries."""
+        self._db.execute("DELETE FROM result_cache WHERE name = ? AND expires_at <= ?", (self.name, time.time()))
+        self._db.execute(
+            "DELETE FROM result_cache WHERE name = ? AND expires_at <= ("
+            "SELECT expires_at FROM result_cache WHERE name = ? ORDER BY expires_at DESC LIMIT 1 OFFSET ?)",
+            (self.name, self.name, self.max_disk_entries),
+        )
+
+    def _store(self, key, value, expires_at):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,225 @@
+# python_nlp_service/modules/resume_index.py
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from python_nlp_service.modules.config_loader import CONFIG
+
+
+def canonical_skill(skill: str) -> str:
+    """Same mapping as ats_scorer.normalize_skill, without loading the scorer."""
+    return CONFIG.get("skill_lookup").get(skill.lower(), skill)
+
+
+class ResumeIndex:
+    """
+    On-disk index of parsed resumes for candidate search (SQLite).
+
+    Stores each parse_resume output once, plus posting lists from canonical skill
+    to resume and from certification to resume, so "top N resumes for these JD
+    skills" is answered from the postings of the JD's own skills instead of
+    re-parsing every file. Resumes are added / replaced / removed one at a time.
+
+    A candidate's score is the share of the JD's distinct skills it has (exact
+    canonical matches, compared in lowercase like match_skills), the same ratio
+    match_skills reports as score_percent.
+    """
+
+    def __init__(self, db_path, normalize: Callable[[str], str] = canonical_skill):
+        self.normalize = normalize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        # WAL: searches keep reading while a resume is being added
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS resumes ("
+            " id INTEGER PRIMARY KEY, resume_id TEXT UNIQUE NOT NULL, filename TEXT,"
+            " years_experience REAL, num_skills INTEGER, data BLOB, added_at REAL);"
+            "CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);"
+            # clustered on skill: one posting list is one contiguous key range
+            "CREATE TABLE IF NOT EXISTS resume_skills ("
+            " skill_id INTEGER, resume INTEGER, PRIMARY KEY (skill_id, resume)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS resume_skills_by_resume ON resume_skills (resume);"
+            "CREATE TABLE IF NOT EXISTS resume_certs ("
+            " cert TEXT, resume INTEGER, PRIMARY KEY (cert, resume)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS resume_certs_by_resume ON resume_certs (resume);"
+            # row counts kept by triggers, so sizes are one lookup instead of a COUNT(*) scan
+            "CREATE TABLE IF NOT EXISTS counts (name TEXT PRIMARY KEY, n INTEGER NOT NULL);"
+            "INSERT OR IGNORE INTO counts SELECT 'resumes', COUNT(*) FROM resumes;"
+            "INSERT OR IGNORE INTO counts SELECT 'skills', COUNT(*) FROM skills;"
+            "CREATE TRIGGER IF NOT EXISTS resumes_added AFTER INSERT ON resumes"
+            " BEGIN UPDATE counts SET n = n + 1 WHERE name = 'resumes'; END;"
+            "CREATE TRIGGER IF NOT EXISTS resumes_removed AFTER DELETE ON resumes"
+            " BEGIN UPDATE counts SET n = n - 1 WHERE name = 'resumes'; END;"
+            "CREATE TRIGGER IF NOT EXISTS skills_added AFTER INSERT ON skills"
+            " BEGIN UPDATE counts SET n = n + 1 WHERE name = 'skills'; END;"
+        )
+        self._db.commit()
+        self._skill_ids: Dict[str, int] = dict(self._db.execute("SELECT name, id FROM skills"))
+
+    # ------------------ Updates ------------------
+    def add(self, resume_id: str, resume_data: Dict, filename: Optional[str] = None) -> List[str]:
+        """Index (or re-index) one parse_resume output; returns its canonical skills (lowercase)."""
+        return self.add_many([(resume_id, resume_data, filename)])[0]
+
+    def add_many(self, items: Iterable[Tuple[str, Dict, Optional[str]]]) -> List[List[str]]:
+        """add() for (resume_id, resume_data, filename) tuples, in a single transaction."""
+        added = []
+        new_skill_ids: Dict[str, int] = {}
+        with self._lock:
+            with self._db:
+                for resume_id, resume_data, filename in items:
+                    added.append(self._add(resume_id, resume_data, filename, new_skill_ids))
+            # only ids that were committed: a rolled-back insert frees its id for reuse
+            self._skill_ids.update(new_skill_ids)
+        return added
+
+    def _add(self, resume_id, resume_data, filename, new_skill_ids):
+        skills = sorted({self.normalize(s).lower() for s in resume_data.get("skills", []) or [] if s})
+        certs = sorted({c.strip().lower() for c in resume_data.get("certifications", []) or [] if c and c.strip()})
+        self._delete(resume_id)
+        cur = self._db.execute(
+            "INSERT INTO resumes (resume_id, filename, years_experience, num_skills, data, added_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                resume_id, filename, float(resume_data.get("years_experience") or 0), len(skills),
+                zlib.compress(json.dumps(resume_data).encode("utf-8")), time.time(),
+            ),
+        )
+        row = cur.lastrowid
+        self._db.executemany(
+            "INSERT INTO resume_skills (skill_id, resume) VALUES (?, ?)",
+            [(self._skill_id(s, new_skill_ids), row) for s in skills],
+        )
+        self._db.executemany("INSERT INTO resume_certs (cert, resume) VALUES (?, ?)", [(c, row) for c in certs])
+        return skills
+
+    def _skill_id(self, name, new_skill_ids):
+        sid = self._skill_ids.get(name) or new_skill_ids.get(name)
+        if sid is None:
+            # another process may have added it since this one loaded the skill table
+            self._db.execute("INSERT OR IGNORE INTO skills (name) VALUES (?)", (name,))
+            sid = self._db.execute("SELECT id FROM skills WHERE name = ?", (name,)).fetchone()[0]
+            new_skill_ids[name] = sid
+        return sid
+
+    def remove(self, resume_id: str) -> bool:
+        """Drop a resume and its postings; False if it was not indexed."""
+        with self._lock, self._db:
+            return self._delete(resume_id)
+
+    def _delete(self, resume_id):
+        found = self._db.execute("SELECT id FROM resumes WHERE resume_id = ?", (resume_id,)).fetchone()
+        if found is None:
+            return False
+        self._db.execute("DELETE FROM resume_skills WHERE resume = ?", found)
+        self._db.execute("DELETE FROM resume_certs WHERE resume = ?", found)
+        self._db.execute("DELETE FROM resumes WHERE id = ?", found)
+        return True
+
+    # ------------------ Lookups ------------------
+    def get(self, resume_id: str) -> Optional[Dict]:
+        """The stored parse_resume output, or None."""
+        with self._lock:
+            row = self._db.execute("SELECT data FROM resumes WHERE resume_id = ?", (resume_id,)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def __contains__(self, resume_id):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM resumes WHERE resume_id = ?", (resume_id,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._count("resumes")
+
+    def _count(self, name):
+        return self._db.execute("SELECT n FROM counts WHERE name = ?", (name,)).fetchone()[0]
+
+    def search(
+        self,
+        jd_skills: Iterable[str],
+        top_n: int = 10,
+        min_years: Optional[float] = None,
+        certifications: Iterable[str] = (),
+    ) -> Dict:
+        """
+        The top_n resumes covering the most of jd_skills, best first (ties: more
+        years of experience, then resume_id). min_years / certifications (all
+        required) filter candidates. Only the postings of the JD's skills are read.
+        """
+        wanted = sorted({self.normalize(s).lower() for s in jd_skills if s})
+        certs = sorted({c.strip().lower() for c in certifications if c and c.strip()})
+        if not wanted:
+            return {"candidates": [], "jd_skills": [], "num_resumes": len(self)}
+
+        with self._lock:
+            names = dict(self._db.execute(
+                f"SELECT id, name FROM skills WHERE name IN ({','.join('?' * len(wanted))})", wanted
+            ))
+            ids = sorted(names)
+            rows = self._db.execute(*self._search_sql(ids, top_n, min_years, certs)).fetchall() if ids else []
+            matched: Dict[int, List[str]] = {row[0]: [] for row in rows}
+            if rows:
+                found = self._db.execute(
+                    f"SELECT resume, skill_id FROM resume_skills WHERE resume IN ({','.join('?' * len(rows))})"
+                    f" AND skill_id IN ({','.join('?' * len(ids))})",
+                    [row[0] for row in rows] + ids,
+                )
+                for row, sid in found:
+                    matched[row].append(names[sid])
+            total = self._count("resumes")
+
+        candidates = []
+        for row, resume_id, filename, years, n in rows:
+            have = set(matched[row])
+            candidates.append({
+                "resume_id": resume_id,
+                "filename": filename,
+                "score_percent": round(n / len(wanted) * 100, 2),
+                "matched_skills": [s for s in wanted if s in have],
+                "missing_skills": [s for s in wanted if s not in have],
+                "years_experience": years,
+            })
+        return {"candidates": candidates, "jd_skills": wanted, "num_resumes": total}
+
+    @staticmethod
+    def _search_sql(ids, top_n, min_years, certs):
+        """(sql, params): count postings per resume over the JD's skill ids, filter, rank."""
+        sql = (
+            "WITH hits AS (SELECT resume, COUNT(*) AS n FROM resume_skills"
+            f" WHERE skill_id IN ({','.join('?' * len(ids))}) GROUP BY resume)"
+            " SELECT r.id, r.resume_id, r.filename, r.years_experience, hits.n"
+            " FROM hits JOIN resumes r ON r.id = hits.resume WHERE 1"
+        )
+        params: List = list(ids)
+        if min_years is not None:
+            sql += " AND r.years_experience >= ?"
+            params.append(min_years)
+        if certs:
+            sql += (
+                f" AND r.id IN (SELECT resume FROM resume_certs WHERE cert IN ({','.join('?' * len(certs))})"
+                " GROUP BY resume HAVING COUNT(*) = ?)"
+            )
+            params.extend(certs + [len(certs)])
+        sql += " ORDER BY hits.n DESC, r.years_experience DESC, r.resume_id LIMIT ?"
+        params.append(top_n)
+        return sql, params
+
+    def stats(self, postings: bool = False) -> Dict:
+        """Sizes for health output; postings=True also counts posting rows (a full scan)."""
+        with self._lock:
+            stats = {
+                "resumes": self._count("resumes"),
+                "skills": self._count("skills"),
+            }
+            if postings:
+                stats["postings"] = self._db.execute("SELECT COUNT(*) FROM resume_skills").fetchone()[0]
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -1,105 +1,125 @@
 # python_nlp_service/modules/resume_parser.py
+import io
 import re
-import json
-import fitz  # PyMuPDF
 import docx
 from pathlib import Path
-from collections import defaultdict
-from typing import List, Dict
+from collections import Counter, defaultdict
+from typing import List, Dict, Union, BinaryIO
+
+from python_nlp_service.modules.config_loader import CONFIG
+from python_nlp_service.modules.nlp_provider import NLP_PROVIDER
+from python_nlp_service.modules.pdf_pages import (
+    BlockStore, open_pdf, use_parallel, iter_pages, extract_pages_parallel,
+)
+
+# optional: vectorized layout diagnostics
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # ------------------ PATHS & CONFIG LOAD ------------------
 BASE_DIR = Path(__file__).resolve().parent.parent  # python_nlp_service/
 
-with open(BASE_DIR / "config/skills_map_final.json", "r", encoding="utf-8") as f:
-    SKILLS_MAP = json.load(f)
+# shared, once-per-process config assets (see config_loader.CONFIG)
+SKILLS_MAP = CONFIG.get("skills_map")
+SKILL_SYNONYMS = CONFIG.get("skill_synonyms")
 
-with open(BASE_DIR / "config/synonym_skills.json", "r", encoding="utf-8") as f:
-    SKILL_SYNONYMS = json.load(f)
+# optional: canonical certs list (used to normalize certs), indexed once and shared with ats_scorer
+CERT_INDEX = CONFIG.get("cert_index")
+CERTIFICATIONS_LIST = CERT_INDEX.certs
 
-# optional: canonical certs list (used to normalize certs)
-try:
-    with open(BASE_DIR / "config/certifications.json", "r", encoding="utf-8") as f:
-        CERTIFICATIONS_LIST = [c.lower() for c in json.load(f)]
-except Exception:
-    CERTIFICATIONS_LIST = []
+# precompiled multi-pattern matcher over all skill variants (snapshotted by the registry)
+SKILL_MATCHER = CONFIG.get("skill_matcher")
 
 # ------------------ OPTIONAL: light NLP (spaCy) ------------------
-try:
-    import spacy  # type: ignore
-    _NLP = spacy.load("en_core_web_sm")
-    NLP_AVAILABLE = True
-except Exception:
-    _NLP = None
-    NLP_AVAILABLE = False
+# name detection only needs NER; the model is shared with ats_scorer and loaded on first use
+NER_NLP = NLP_PROVIDER.view("ner")
+
+# ------------------ INPUT SOURCES ------------------
+# a resume can be given as a path (CLI runners) or in memory (uploads): bytes or a binary stream
+ResumeSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+def _is_in_memory(source) -> bool:
+    return isinstance(source, (bytes, bytearray, memoryview))
+
+def _read_source(source: ResumeSource):
+    """Return a path (str) or the file contents (bytes); streams are read fully."""
+    if isinstance(source, Path):
+        return str(source)
+    if hasattr(source, "read"):
+        return source.read()
+    return source
+
+def detect_file_format(source, filename: str = None) -> str:
+    """'pdf' or 'docx' from the filename/path extension, else from the leading bytes."""
+    name = filename or (source if isinstance(source, str) else "")
+    if name.lower().endswith(".pdf"):
+        return "pdf"
+    if name.lower().endswith(".docx"):
+        return "docx"
+    if not name and _is_in_memory(source):
+        head = bytes(source[:5])
+        if head.startswith(b"%PDF-"):
+            return "pdf"
+        if head.startswith(b"PK"):
+            return "docx"
+    raise ValueError("Unsupported file format: PDF/DOCX only")
 
 # ------------------ TEXT + LAYOUT + IMAGE EXTRACTION ------------------
-def extract_pdf_data(pdf_path: str, preserve_layout: bool = True) -> Dict:
+def extract_pdf_data(pdf_path: ResumeSource, preserve_layout: bool = True, parallel: bool = None,
+                     max_pages: int = None, max_chars: int = None, keep_blocks: bool = True) -> Dict:
     """
     Single-pass PDF read that returns:
-      { "text": <joined text>, "blocks": [ {page, x0,y0,x1,y1, text} ... ],
-        "images": [ {page, xref, ext, w,h} ... ], "page_count": n }
+      { "text": <joined text>, "blocks": BlockStore (.to_dicts() -> [ {page, x0,y0,x1,y1, text} ... ]),
+        "images": [ {page, xref, ext, w,h} ... ], "layout": detect_multicolumn(blocks),
+        "page_count": n, "pages_parsed": k }
     Uses 'blocks' to preserve spatial ordering (helps 2-column/resume layouts).
+    pdf_path may also be the PDF bytes or a binary stream (opened from memory).
+    parallel: split the pages across worker processes (None = decided by
+    pdf_pages.use_parallel: PDF_PARALLEL_MIN_PAGES pages or more, 2+ workers).
+    max_pages / max_chars: quick mode, stop after that many pages, or after the page
+    that brings the extracted text to max_chars (pages_parsed < page_count then).
+    keep_blocks=False: "blocks" is None; pages are read one at a time and each page's
+    blocks are dropped once counted into "layout", so only the text is held in full.
     """
-    doc = fitz.open(pdf_path)
-    blocks_all = []
-    pages_text = []
-    images_meta = []
-
-    for pno, page in enumerate(doc):
-        try:
-            blocks = page.get_text("blocks")
-        except Exception:
-            blocks = []
-
-        # Sort blocks (tolerant to floats + rounding noise)
-        if blocks:
-            blocks_sorted = sorted(blocks, key=lambda b: (round(b[1], 1), round(b[0], 1)))
-            page_text_parts = []
-            for b in blocks_sorted:
-                txt = b[4] if len(b) > 4 else ""
-                if isinstance(txt, str) and txt.strip():
-                    page_text_parts.append(txt.strip())
-                blocks_all.append({
-                    "page": pno + 1,
-                    "x0": float(b[0]),
-                    "y0": float(b[1]),
-                    "x1": float(b[2]),
-                    "y1": float(b[3]),
-                    "text": txt.strip() if isinstance(txt, str) else str(txt)
-                })
-            pages_text.append("\n".join(page_text_parts).strip())
-        else:
-            # fallback plain text
-            try:
-                t = page.get_text("text") or ""
-                pages_text.append(t.strip())
-            except Exception:
-                pages_text.append("")
-
-        # images metadata (skip heavy extraction)
-        try:
-            for img in page.get_images(full=True):
-                xref = img[0]
-                try:
-                    img_meta = doc.extract_image(xref)
-                    images_meta.append({
-                        "page": pno + 1,
-                        "xref": xref,
-                        "ext": img_meta.get("ext"),
-                        "width": img_meta.get("width"),
-                        "height": img_meta.get("height")
-                    })
-                except Exception:
-                    images_meta.append({"page": pno + 1, "xref": xref})
-        except Exception:
-            pass
+    src = _read_source(pdf_path)
+    doc = open_pdf(src)
+    page_count = len(doc)
+    stop = min(page_count, max_pages) if max_pages else page_count
+    if parallel is None:
+        parallel = use_parallel(stop)
+    if parallel and stop > 1 and not max_chars:
+        doc.close()
+        blocks_all, pages_text, images_meta = extract_pages_parallel(src, stop)
+        x0_counts = _count_x0_clusters(blocks_all.x0, Counter())
+    else:
+        blocks_all = BlockStore() if keep_blocks else None
+        pages_text, images_meta = [], []
+        x0_counts = Counter()
+        chars = 0
+        with doc:
+            for _, blocks, page_text, images in iter_pages(doc, 0, stop):
+                _count_x0_clusters(blocks.x0, x0_counts)
+                if keep_blocks:
+                    blocks_all.extend(blocks)
+                pages_text.append(page_text)
+                images_meta.extend(images)
+                chars += len(page_text)
+                if max_chars and chars >= max_chars:
+                    break
 
     text = "\n".join(pages_text).strip()
-    return {"text": text, "blocks": blocks_all, "images": images_meta, "page_count": len(doc)}
+    return {"text": text, "blocks": blocks_all if keep_blocks else None, "images": images_meta,
+            "layout": _multicolumn_from_counts(x0_counts),
+            "page_count": page_count, "pages_parsed": len(pages_text)}
 
-def extract_text_from_docx(docx_path: str) -> str:
+def extract_text_from_docx(docx_path: ResumeSource) -> str:
     try:
-        doc = docx.Document(docx_path)
+        src = _read_source(docx_path)
+        doc = docx.Document(io.BytesIO(src) if _is_in_memory(src) else src)
         return "\n".join([p.text for p in doc.paragraphs])
     except Exception:
         return ""
@@ -137,9 +157,9 @@ def extract_contact_info(text: str) -> Dict:
 
     # Name detection
     name = None
-    if NLP_AVAILABLE:
+    if NER_NLP.available:
         try:
-            doc = _NLP(header_snippet)
+            doc = NER_NLP(header_snippet)
             for ent in doc.ents:
                 if ent.label_ == "PERSON":
                     name = ent.text.strip()
@@ -169,6 +189,74 @@ SECTION_PATTERNS = {
     "experience_alt": re.compile(r"\b(employment|professional profile|professional background)\b", re.I),
 }
 
+# all patterns as one alternation with named groups: a single search finds the leftmost
+# header keyword of any section (ties go to the earlier pattern)
+SECTION_HEADER_RE = re.compile("|".join(rf"(?P<{name}>{p.pattern})" for name, p in SECTION_PATTERNS.items()), re.I)
+_SECTION_PRIORITY = list(SECTION_PATTERNS.items())
+_SECTION_RANK = {name: i for i, (name, _) in enumerate(_SECTION_PRIORITY)}
+
+def _literal_stems(patterns) -> List[str]:
+    """
+    The longest literal run of every alternative in patterns shaped like
+    r"\b(alt1|alt2|...)\b" -- a line can only contain a header if it contains one
+    of these. Returns [] (no prefilter) if a pattern has any other shape.
+    """
+    stems = []
+    for p in patterns:
+        m = re.fullmatch(r"\\b\((.*)\)\\b", p.pattern)
+        if not m or "(" in m.group(1) or ")" in m.group(1):
+            return []
+        for alt in m.group(1).split("|"):
+            runs, run, i = [], "", 0
+            while i < len(alt):
+                if alt[i] == "\\" or alt[i] in ".[]*+?{}^$":
+                    runs.append(run)
+                    run = ""
+                    i += 2 if alt[i] == "\\" else 1
+                elif i + 1 < len(alt) and alt[i + 1] in "?*{":  # optional char
+                    runs.append(run)
+                    run = ""
+                    i += 1
+                else:
+                    run += alt[i]
+                    i += 1
+            runs.append(run)
+            stem = max(runs, key=len)
+            if not stem:
+                return []
+            stems.append(stem.lower())
+    # "key skills" is implied by "skills"
+    return sorted({s for s in stems if not any(o != s and o in s for o in stems)})
+
+# cheap screen before SECTION_HEADER_RE: most lines contain none of the keywords.
+# re.I also lets these non-ASCII letters match ASCII ones ("K" KELVIN SIGN lowers to "k"),
+# so they are folded first and a lowercase substring search stays exact.
+_FOLD_TO_ASCII = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+_SECTION_STEMS = _literal_stems(SECTION_PATTERNS.values())
+_SECTION_STEMS_RE = re.compile("|".join(map(re.escape, _SECTION_STEMS))) if _SECTION_STEMS else None
+
+def match_section_header(line: str):
+    """
+    (section name, end offset of the header keyword) for a stripped line, or (None, 0).
+    Same answer as trying SECTION_PATTERNS in order with .search(): the first pattern that
+    matches anywhere wins. The combined search gives the leftmost hit; higher-priority
+    patterns cannot match at or before it, so only they are re-checked, past that point.
+    """
+    if _SECTION_STEMS_RE is not None:
+        low = line.lower()
+        if not line.isascii() and ("\u0130" in line or "\u0131" in line or "\u017f" in line):
+            low = line.translate(_FOLD_TO_ASCII).lower()
+        if not _SECTION_STEMS_RE.search(low):
+            return None, 0
+    m = SECTION_HEADER_RE.search(line)
+    if not m:
+        return None, 0
+    for name, pattern in _SECTION_PRIORITY[:_SECTION_RANK[m.lastgroup]]:
+        higher = pattern.search(line, m.start() + 1)
+        if higher:
+            return name, higher.end()
+    return m.lastgroup, m.end()
+
 # common bullets (kept)
 BULLET_CHARS = "-\u2022\u2023\u25E6\u2043\u2219\u00B7\u25B8\u25B6\u2192\u27A2*•·▪◦»›"
 _LEADING_BULLET_RE = re.compile(rf'^[\s{re.escape(BULLET_CHARS)}\d\.\)\:]+', re.UNICODE)
@@ -187,17 +275,10 @@ def parse_resume_sections(text: str) -> Dict:
         if not stripped:
             continue
 
-        matched = None
-        match_obj = None
-        for name, pattern in SECTION_PATTERNS.items():
-            m = pattern.search(stripped)
-            if m:
-                matched = name
-                match_obj = m
-                break
+        matched, header_end = match_section_header(stripped)
 
         if matched:
-            after = stripped[match_obj.end():].strip(" :\t-–—")
+            after = stripped[header_end:].strip(" :\t-–—")
             current = matched
             if after:
                 sections_lines[current].append(after)
@@ -351,17 +432,9 @@ def extract_skills_from_text(text: str) -> List[str]:
     """
     Use SKILL_SYNONYMS and SKILLS_MAP for canonical extraction (unchanged approach).
     Uses word-boundary tolerant matching to capture C++, Node.js, etc.
+    All variants are matched in a single pass by SKILL_MATCHER.
     """
-    text_lower = (text or "").lower()
-    found = set()
-    for canonical, variants in SKILL_SYNONYMS.items():
-        for v in variants:
-            if re.search(rf'(?<!\w){re.escape(v.lower())}(?!\w)', text_lower):
-                found.add(canonical)
-    for raw, canonical in SKILLS_MAP.items():
-        if re.search(rf'(?<!\w){re.escape(raw.lower())}(?!\w)', text_lower):
-            found.add(canonical)
-    return sorted(found)
+    return sorted(SKILL_MATCHER.find_canonicals((text or "").lower()))
 
 def extract_experience_years(text: str) -> int:
     if not text:
@@ -382,61 +455,80 @@ def extract_certifications_from_text(text: str) -> List[str]:
     normalized = []
     for p in pts:
         p_clean = p.strip()
-        matched = None
-        for c in CERTIFICATIONS_LIST:
-            if c and (c in p_clean.lower() or p_clean.lower() in c):
-                matched = c
-                break
+        # first cert (list order) contained in the point or containing it
+        matched = CERT_INDEX.match(p_clean.lower())
         normalized.append(matched or p_clean)
     return normalized
 
 # ------------------ LAYOUT DIAGNOSTICS (NEW) ------------------
-def detect_multicolumn(blocks: List[Dict]) -> Dict:
+# below this many blocks the plain loop beats NumPy's per-call overhead
+MULTICOLUMN_VECTORIZE_MIN = 64
+
+def detect_multicolumn(blocks: Union[BlockStore, List[Dict]]) -> Dict:
     """
     Heuristic: check how many distinct x0 clusters exist.
     Returns {"multicolumn": bool, "num_columns_est": int}
     """
     if not blocks:
         return {"multicolumn": False, "num_columns_est": 1}
-    x0s = [int(round(b["x0"])) for b in blocks]
+    x0s = blocks.x0 if isinstance(blocks, BlockStore) else [b["x0"] for b in blocks]
+    return _multicolumn_from_counts(_count_x0_clusters(x0s, Counter()))
+
+def _count_x0_clusters(x0s, counts: Counter) -> Counter:
+    """Add block x0s to per-cluster counts (extract_pdf_data feeds it one page at a time)."""
     # cluster by rounding to nearest 50 pixels
-    clusters = {}
-    for x in x0s:
-        key = (x // 50) * 50
-        clusters.setdefault(key, 0)
-        clusters[key] += 1
-    num_clusters = len([k for k, v in clusters.items() if v >= 2])
+    if NUMPY_AVAILABLE and len(x0s) >= MULTICOLUMN_VECTORIZE_MIN:
+        keys = (np.rint(np.asarray(x0s, dtype=np.float64)).astype(np.int64) // 50) * 50
+        keys, n = np.unique(keys, return_counts=True)
+        counts.update(dict(zip(keys.tolist(), n.tolist())))
+    else:
+        for x in x0s:
+            counts[(int(round(x)) // 50) * 50] += 1
+    return counts
+
+def _multicolumn_from_counts(counts: Counter) -> Dict:
+    num_clusters = sum(1 for v in counts.values() if v >= 2)
     multi = num_clusters >= 2
     return {"multicolumn": multi, "num_columns_est": num_clusters if multi else 1}
 
 # ------------------ MAIN PARSER (MODIFIED: integrates all new features, keeps old return shape) ------------------
-def parse_resume(file_path: str):
+def parse_resume(file_path: ResumeSource, filename: str = None, max_pages: int = None, max_chars: int = None,
+                 include_blocks: bool = False):
     """
     Returns dict with keys expected by ats_scorer plus extras:
       - skills, experience, education, projects, achievements, certifications, years_experience, raw_text, sections
     New extras:
       - contact (dict), experience_timeline (list), experience_entries (list),
       - graphics (list image meta), layout (diagnostics), warnings (list)
+    file_path may be a path, or the upload itself as bytes / a binary stream;
+    for in-memory input the format comes from `filename`, else from the file signature.
+    max_pages / max_chars: quick mode for PDFs (see extract_pdf_data); a truncated
+    parse adds the "partial_parse" warning.
+    include_blocks: also return the PDF text blocks as "blocks" ([{page, x0, y0, x1, y1, text}]).
     """
     warnings = []
+    file_path = _read_source(file_path)
+    file_format = detect_file_format(file_path, filename)
     # 1) read file with layout + image awareness
-    if file_path.lower().endswith(".pdf"):
-        pdf_data = extract_pdf_data(file_path, preserve_layout=True)  # --- MODIFIED/NEW
+    if file_format == "pdf":
+        # blocks are only held in full when returned; the layout check is counted page by page
+        pdf_data = extract_pdf_data(file_path, preserve_layout=True, max_pages=max_pages, max_chars=max_chars,
+                                    keep_blocks=include_blocks)
         raw = pdf_data.get("text", "")
-        blocks = pdf_data.get("blocks", [])
+        blocks = pdf_data.get("blocks") or BlockStore()
         images = pdf_data.get("images", [])
         page_count = pdf_data.get("page_count", 0)
-        layout_info = detect_multicolumn(blocks)
+        layout_info = pdf_data["layout"]
         if images and len(images) > 6:
             warnings.append("resume_contains_many_images")
-    elif file_path.lower().endswith(".docx"):
+        if pdf_data.get("pages_parsed", page_count) < page_count:
+            warnings.append("partial_parse")
+    else:
         raw = extract_text_from_docx(file_path)
-        blocks = []
+        blocks = BlockStore()
         images = []
         page_count = 0
         layout_info = {"multicolumn": False, "num_columns_est": 1}
-    else:
-        raise ValueError("Unsupported file format: PDF/DOCX only")
 
     text = clean_text(raw)
 
@@ -525,6 +617,8 @@ def parse_resume(file_path: str):
         "page_count": page_count,
         "warnings": warnings,
     }
+    if include_blocks:
+        result["blocks"] = blocks.to_dicts()
     return result
 
 # ------------------ DEBUG RUN ------------------
@@ -0,0 +1,126 @@
+# python_nlp_service/modules/role_index.py
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# optional: vectorized score accumulation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+Role = Tuple[str, str]  # (Title, ExperienceLevel)
+
+
+class RoleIndex:
+    """
+    Inverted index from normalized skill to the (Title, ExperienceLevel) roles
+    of job_dataset.json, for "which roles fit this resume best".
+
+    A role's fit is the mean, over its JDs, of the share of each JD's skills the
+    resume has (matched distinct skills / len(jd["Skills"]), the ratio behind
+    match_skills' score_percent, on exact normalized matches compared in lowercase
+    like match_skills does). That mean is a sum
+    of per-skill terms, so each skill's posting list stores its precomputed
+    contribution to every role listing it:
+        weight(skill, role) = sum over the role's JDs with skill of 1 / (len(jd skills) * role JD count)
+    and a query only walks the postings of the resume's own skills.
+    """
+
+    def __init__(self, dataset: Iterable[Dict], normalize: Callable[[str], str]):
+        self.roles: List[Role] = []
+        self.role_sizes: List[int] = []
+        role_ids: Dict[Role, int] = {}
+        jd_rows = []  # (role id, lowercase key -> distinct normalized skills with it, raw skill count)
+        normalized: Dict[str, str] = {}  # distinct raw skills are far fewer than JDs
+        self._display: Dict[str, str] = {}  # lowercase key -> first normalized spelling seen
+        for jd in dataset:
+            role = (jd.get("Title", ""), jd.get("ExperienceLevel", ""))
+            rid = role_ids.get(role)
+            if rid is None:
+                rid = role_ids[role] = len(self.roles)
+                self.roles.append(role)
+                self.role_sizes.append(0)
+            self.role_sizes[rid] += 1
+            raw_skills = jd.get("Skills", []) or []
+            skills = set()
+            for raw in raw_skills:
+                norm = normalized.get(raw)
+                if norm is None:
+                    norm = normalized[raw] = normalize(raw)
+                skills.add(norm)
+            # match_skills counts distinct normalized JD skills but compares them lowercased,
+            # so "SQL" and "sql" in one JD are two matches for a resume listing either
+            keys: Dict[str, int] = defaultdict(int)
+            for norm in skills:
+                key = norm.lower()
+                keys[key] += 1
+                self._display.setdefault(key, norm)
+            jd_rows.append((rid, keys, len(raw_skills)))
+
+        by_skill: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for rid, keys, length in jd_rows:
+            if not length:
+                continue
+            weight = 1.0 / (length * self.role_sizes[rid])
+            for key, count in keys.items():
+                by_skill[key][rid] += count * weight
+        # lowercase skill -> (role ids ascending, weights)
+        self._postings: Dict[str, Tuple[List[int], List[float]]] = {}
+        for skill, weights in by_skill.items():
+            ids = sorted(weights)
+            self._postings[skill] = (ids, [weights[rid] for rid in ids])
+
+        # tie-break: more JDs first, then alphabetical
+        self._tie_rank = [0] * len(self.roles)
+        for rank, rid in enumerate(sorted(range(len(self.roles)), key=lambda r: (-self.role_sizes[r], self.roles[r]))):
+            self._tie_rank[rid] = rank
+        if NUMPY_AVAILABLE:
+            self._np_postings = {
+                skill: (np.asarray(ids, dtype=np.int64), np.asarray(w, dtype=np.float64))
+                for skill, (ids, w) in self._postings.items()
+            }
+            self._np_tie_rank = np.asarray(self._tie_rank, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.roles)
+
+    def _ranked(self, skills: List[str], k: int) -> List[Tuple[int, float]]:
+        if NUMPY_AVAILABLE:
+            scores = np.zeros(len(self.roles), dtype=np.float64)
+            for skill in skills:
+                ids, weights = self._np_postings[skill]
+                scores[ids] += weights  # ids are unique per posting list
+            candidates = np.flatnonzero(scores)
+            order = np.lexsort((self._np_tie_rank[candidates], -scores[candidates]))[:k]
+            return [(int(rid), float(scores[rid])) for rid in candidates[order]]
+        scores: Dict[int, float] = defaultdict(float)
+        for skill in skills:
+            for rid, weight in zip(*self._postings[skill]):
+                scores[rid] += weight
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._tie_rank[item[0]]))
+        return ranked[:k]
+
+    def top_roles(self, skills: Iterable[str], k: int = 10) -> List[Dict]:
+        """The k best-fitting roles for a set of normalized skills, best first."""
+        # fixed summation order: equal scores must compare equal on every run
+        skills = sorted({s.lower() for s in skills} & self._postings.keys())
+        results = []
+        for rid, score in self._ranked(skills, k):
+            title, level = self.roles[rid]
+            matched = []
+            for skill in skills:
+                ids = self._postings[skill][0]
+                i = bisect_left(ids, rid)
+                if i < len(ids) and ids[i] == rid:
+                    matched.append(self._display[skill])
+            results.append({
+                "title": title,
+                "experience_level": level,
+                "score_percent": round(score * 100, 2),
+                "num_jds": self.role_sizes[rid],
+                "matched_skills": matched,
+            })
+        return results
@@ -1,36 +1,125 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Dict, Iterable, List, Optional
+
+# optional: TF-IDF text similarity needs scikit-learn (and NumPy / SciPy with it)
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    np = None
+    TfidfVectorizer = None
+    SKLEARN_AVAILABLE = False
+
+
+def _as_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(map(str, value))
+    return str(value or "")
+
+
+def resume_text(resume_data: Dict) -> str:
+    """The resume fields compared against JD text."""
+    return " ".join([
+        _as_text(resume_data.get("skills", [])),
+        _as_text(resume_data.get("education", "")),
+        _as_text(resume_data.get("experience", "")),
+        _as_text(resume_data.get("projects", "")),
+    ])
+
+
+def jd_text(jd: Dict) -> str:
+    """The JD fields JDTextModel vectorizes (the corpus model also reads Keywords / Responsibilities)."""
+    return " ".join([
+        _as_text(jd.get("Skills", [])),
+        _as_text(jd.get("Keywords", [])),
+        _as_text(jd.get("Responsibilities", "")),
+        _as_text(jd.get("Education", [])),
+        _as_text(jd.get("YearsOfExperience", [])),
+        _as_text(jd.get("Certifications", [])),
+    ])
+
+
+def pair_jd_text(jd: Dict) -> str:
+    """The JD fields the pairwise scorer (no model) has always compared; kept so its scores do not move."""
+    return " ".join([
+        _as_text(jd.get("Skills", [])),
+        _as_text(jd.get("Education", [])),
+        _as_text(jd.get("YearsOfExperience", [])),
+        _as_text(jd.get("Certifications", [])),
+    ])
+
+
+class JDTextModel:
+    """
+    TF-IDF vectorizer fitted once on the whole JD corpus, plus every JD's
+    vector as one L2-normalized sparse matrix (row i = dataset[i]).
+
+    Scoring a resume against any set of JDs is then one transform of the resume
+    text and one sparse mat-vec: with unit rows, cosine similarity is the dot product.
+    Only the vocabulary, IDF weights and matrix are pickled (see config_loader's
+    "jd_text_model" snapshot); the vectorizer is rebuilt from them on first use.
+    """
+
+    def __init__(self, dataset: Iterable[Dict]):
+        vectorizer = TfidfVectorizer(stop_words="english", dtype=np.float32)
+        self.matrix = vectorizer.fit_transform([jd_text(jd) for jd in dataset]).tocsr()
+        self.vocabulary = vectorizer.vocabulary_
+        self.idf = vectorizer.idf_.astype(np.float32)
+        self._vectorizer = vectorizer
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_vectorizer"] = None
+        return state
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    @property
+    def vectorizer(self):
+        if self._vectorizer is None:
+            vectorizer = TfidfVectorizer(stop_words="english", dtype=np.float32, vocabulary=self.vocabulary)
+            vectorizer.idf_ = self.idf
+            self._vectorizer = vectorizer
+        return self._vectorizer
+
+    def rows(self, positions: List[int]):
+        """JD vectors for dataset positions (slice once per job, reuse per resume)."""
+        return self.matrix[positions]
+
+    def transform(self, text: str):
+        return self.vectorizer.transform([text])
+
+    def similarities(self, text: str, rows=None) -> List[float]:
+        """Cosine similarity (0-100) of text against each row of `rows` (default: every JD)."""
+        rows = self.matrix if rows is None else rows
+        if not text.strip() or rows.shape[0] == 0:
+            return [0.0] * rows.shape[0]
+        sims = rows @ self.transform(text).T  # (n_jds x 1) sparse
+        return (sims.toarray().ravel() * 100).tolist()
 
 
 class SimilarityScorer:
     """
     TF-IDF + cosine similarity scorer.
     Compares JD text vs Resume text for overall semantic alignment.
+    With a JDTextModel the corpus IDF weights and JD fields (jd_text) are used;
+    without one, a vectorizer is fitted on the two texts alone (pair_jd_text).
     """
 
-    def __init__(self, resume_data: dict, jd: dict):
+    def __init__(self, resume_data: dict, jd: dict, model: Optional[JDTextModel] = None):
         self.resume_data = resume_data
         self.jd = jd
+        self.model = model
 
     def _prepare_texts(self):
         """
         Flatten resume + JD dicts into comparable text strings.
         """
-        resume_text = " ".join([
-            " ".join(self.resume_data.get("skills", [])),
-            self.resume_data.get("education", ""),
-            self.resume_data.get("experience", ""),
-            self.resume_data.get("projects", ""),
-        ])
-
-        jd_text = " ".join([
-            " ".join(self.jd.get("Skills", [])),
-            " ".join(self.jd.get("Education", [])),
-            " ".join(map(str, self.jd.get("YearsOfExperience", []))),
-            " ".join(self.jd.get("Certifications", [])),
-        ])
-
-        return resume_text, jd_text
+        if self.model is not None:
+            return resume_text(self.resume_data), jd_text(self.jd)
+        return resume_text(self.resume_data), pair_jd_text(self.jd)
 
     def compute_similarity(self) -> float:
         """
@@ -42,6 +131,9 @@ class SimilarityScorer:
         if not resume_text.strip() or not jd_text.strip():
             return 0.0
 
+        if self.model is not None:
+            return self.model.similarities(resume_text, rows=self.model.transform(jd_text))[0]
+
         vectorizer = TfidfVectorizer(stop_words="english")
         tfidf_matrix = vectorizer.fit_transform([resume_text, jd_text])
 
@@ -0,0 +1,122 @@
+# python_nlp_service/modules/skill_matcher.py
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def build_variant_lookup(skill_synonyms: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Lowercased canonical name / variant -> canonical skill, for O(1) normalization.
+    The first canonical listing a variant wins, matching the old linear scans
+    over synonym_skills.json.
+    """
+    lookup: Dict[str, str] = {}
+    for canonical, variants in skill_synonyms.items():
+        lookup.setdefault(canonical.lower(), canonical)
+        for v in variants:
+            lookup.setdefault(v.lower(), canonical)
+    return lookup
+
+
+def _is_word_char(ch: str) -> bool:
+    # same definition as regex \w on str patterns
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over lowercased skill variants.
+
+    Built once at load time; `find_canonicals` scans the text in a single
+    linear pass and applies the same boundary rule the per-skill regex used,
+    i.e. rf'(?<!\\w){re.escape(variant)}(?!\\w)', so variants such as
+    "c++", "c#" and "node.js" match exactly as before.
+    With word_boundaries=False every occurrence counts (plain `variant in text`).
+    """
+
+    def __init__(self, variants: Dict[str, Iterable[str]], word_boundaries: bool = True):
+        """
+        variants: {lowercased variant: canonical names it maps to}
+        """
+        self._word_boundaries = word_boundaries
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # per state: list of (variant length, canonicals) ending at this state
+        self._out: List[List[Tuple[int, Tuple[str, ...]]]] = [[]]
+
+        for variant, canonicals in variants.items():
+            if variant:
+                self._add(variant, tuple(sorted(set(canonicals))))
+        self._build_fail_links()
+
+    @classmethod
+    def from_config(cls, skill_synonyms: Dict[str, List[str]], skills_map: Dict[str, str]) -> "SkillMatcher":
+        """Build from synonym_skills.json + skills_map_final.json (same sources as the regex path)."""
+        variants: Dict[str, Set[str]] = {}
+        for canonical, vs in skill_synonyms.items():
+            for v in vs:
+                variants.setdefault(v.lower(), set()).add(canonical)
+        for raw, canonical in skills_map.items():
+            variants.setdefault(raw.lower(), set()).add(canonical)
+        return cls(variants)
+
+    def _add(self, pattern: str, canonicals: Tuple[str, ...]) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), canonicals))
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                link = self._goto[f].get(ch, 0)
+                self._fail[nxt] = link if link != nxt else 0
+                # inherit outputs of the longest proper suffix
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    @property
+    def num_states(self) -> int:
+        return len(self._goto)
+
+    def find_canonicals(self, text_lower: str) -> Set[str]:
+        """Return canonical skills whose variants occur in `text_lower` (on word boundaries, if enabled)."""
+        found: Set[str] = set()
+        if not text_lower:
+            return found
+        goto, fail, out = self._goto, self._fail, self._out
+        if not self._word_boundaries:
+            state = 0
+            for ch in text_lower:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                for _, canonicals in out[state]:
+                    found.update(canonicals)
+            return found
+        n = len(text_lower)
+        state = 0
+        for i, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            if i + 1 < n and _is_word_char(text_lower[i + 1]):
+                continue
+            for length, canonicals in out[state]:
+                start = i - length + 1
+                if start == 0 or not _is_word_char(text_lower[start - 1]):
+                    found.update(canonicals)
+        return found
@@ -1,15 +1,11 @@
 # python_nlp_service/modules/skills_standardizer.py
-import json
-from pathlib import Path
+from python_nlp_service.modules.config_loader import CONFIG
 
-SKILLS_MAP_FILE = Path(__file__).parent.parent / "config/skills_map_final.json"
-SYNONYM_SKILLS_FILE = Path(__file__).parent.parent / "config/synonym_skills.json"
+SKILLS_MAP = CONFIG.get("skill_names")
+SYNONYM_MAP = CONFIG.get("skill_synonyms")
 
-with open(SKILLS_MAP_FILE, "r", encoding="utf-8") as f:
-    SKILLS_MAP = set(json.load(f))
-
-with open(SYNONYM_SKILLS_FILE, "r", encoding="utf-8") as f:
-    SYNONYM_MAP = json.load(f)
+# lowercase variant -> canonical skill (same object as ats_scorer.normalize_skill uses)
+SYNONYM_LOOKUP = CONFIG.get("skill_lookup")
 
 
 def standardize_skills(raw_skills):
@@ -18,12 +14,7 @@ def standardize_skills(raw_skills):
     """
     normalized = set()
     for skill in raw_skills:
-        skill_lower = skill.lower()
-        mapped = None
-        for key, synonyms in SYNONYM_MAP.items():
-            if skill_lower in [s.lower() for s in synonyms]:
-                mapped = key
-                break
+        mapped = SYNONYM_LOOKUP.get(skill.lower())
         if mapped:
             normalized.add(mapped)
         elif skill in SKILLS_MAP:
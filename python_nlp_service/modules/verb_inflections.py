@@ -0,0 +1,108 @@
+# python_nlp_service/modules/verb_inflections.py
+import re
+from typing import Dict, Iterable, List, Set
+
+_WORD_RE = re.compile(r"[a-z]+")
+_VOWELS = set("aeiou")
+# past-tense stems that dropped a silent "e" ("accelerat|ed" -> "accelerate")
+_SILENT_E_ENDINGS = ("v", "c", "u", "g", "z", "at", "is", "ys", "as", "bl", "pl", "dl", "tl", "gl", "kl")
+_NO_SILENT_E_ENDINGS = ("eat", "oat")  # treat|ed, float|ed
+# ... and vowel + consonant endings that did, when the vowel follows a consonant
+# ("combin|ed" -> "combine", but "attain|ed" -> "attain")
+_SILENT_E_AFTER_CONSONANT = ("it", "ut", "ot", "in", "ir", "ur", "os", "id", "od", "ud", "ad", "ar", "ap", "ib", "il", "ul")
+
+
+def _lemma_of_past(past: str) -> str:
+    """Best-effort lemma for a regular past form (overrides cover the exceptions)."""
+    if not past.endswith("ed") or len(past) <= 3:
+        return past
+    stem = past[:-2]
+    if stem.endswith("i"):
+        return stem[:-1] + "y"  # classified -> classify
+    if len(stem) > 2 and stem[-1] == stem[-2] and stem[-1] not in _VOWELS and stem[-1] != "s":
+        return stem[:-1]  # planned -> plan, controlled -> control (installed -> instal, see _forms)
+    if stem.endswith(_SILENT_E_ENDINGS) and not stem.endswith(_NO_SILENT_E_ENDINGS):
+        return stem + "e"
+    if stem.endswith(_SILENT_E_AFTER_CONSONANT) and len(stem) > 2 and stem[-3] not in _VOWELS:
+        return stem + "e"
+    return stem
+
+
+def _forms(lemma: str, past: str) -> Set[str]:
+    """Past, gerund and third-person forms of one verb."""
+    stem = past[:-2] if past.endswith("ed") else lemma
+    if lemma.endswith("e") and not lemma.endswith(("ee", "ye", "oe")):
+        gerund = lemma[:-1] + "ing"
+    elif stem != lemma and stem.startswith(lemma) and not lemma.endswith("y"):
+        gerund = stem + "ing"  # doubled consonant: planning, controlling
+    else:
+        gerund = lemma + "ing"
+    if lemma.endswith("y") and lemma[-2:-1] not in _VOWELS:
+        third = lemma[:-1] + "ies"
+    elif lemma.endswith(("s", "x", "z", "ch", "sh")):
+        third = lemma + "es"
+    else:
+        third = lemma + "s"
+    forms = {past, gerund, third}
+    if stem.endswith("ll"):
+        forms.add(stem + "s")  # control|s vs install|s: keep both spellings
+    return forms
+
+
+class ActionVerbTable:
+    """
+    Surface form -> lemma for the configured action verbs, and lemma -> the
+    configured entries the spaCy path would report for that lemma, i.e.
+    [v for v in verbs if lemma in v or v in lemma]. find() then needs one dict
+    lookup per word instead of a tagger pass and a scan over every entry.
+
+    Only inflected forms (past, gerund, third person) are indexed; bare forms
+    such as "design" or "project" are mostly nouns in resumes. The table does
+    not see POS tags, so its output can still differ from spaCy's on nouns that
+    share an inflected form ("projects"). `ambiguous` forms are left out for that reason.
+    """
+
+    def __init__(self, verbs: Iterable[str], overrides: Dict[str, List[str]] = None, ambiguous: Iterable[str] = ()):
+        """
+        verbs: action_verbs.json entries (lowercased)
+        overrides: entry -> [lemma, other forms...] for irregular verbs ("led": ["lead", "leads", "leading"])
+        """
+        self.verbs: List[str] = list(dict.fromkeys(verbs))
+        self._verb_set = set(self.verbs)
+        overrides = overrides or {}
+        ambiguous = set(ambiguous)
+        self.lemma_of: Dict[str, str] = {}
+        lemmas = []
+        for entry in self.verbs:
+            # the token spaCy lemmatizes: "set up" -> "set", "co-authored" -> "authored"
+            head = _WORD_RE.findall(entry.split()[0])[-1] if entry.strip() else ""
+            if not head:
+                continue
+            if entry in overrides:
+                lemma, *extra = overrides[entry]
+                forms = {head, *extra}
+            else:
+                lemma = _lemma_of_past(head)
+                forms = _forms(lemma, head)
+            for form in forms:
+                if form not in ambiguous:
+                    self.lemma_of.setdefault(form, lemma)
+            lemmas.append(lemma)
+        self.matches_of: Dict[str, tuple] = {
+            lemma: tuple(v for v in self.verbs if lemma in v or v in lemma) for lemma in lemmas
+        }
+
+    def find(self, text: str, strict: bool = False) -> List[str]:
+        """Sorted configured verbs found in text (same contract as extract_action_verbs)."""
+        found = set()
+        lemma_of = self.lemma_of
+        for word in set(_WORD_RE.findall((text or "").lower())):
+            lemma = lemma_of.get(word)
+            if lemma is None:
+                continue
+            if strict:
+                if lemma in self._verb_set:
+                    found.add(lemma)
+            else:
+                found.update(self.matches_of[lemma])
+        return sorted(found)
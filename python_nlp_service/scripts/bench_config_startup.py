@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_config_startup.py
+"""
+Measure what a fresh worker pays to load the shared config assets, with the
+registry snapshots disabled (rebuild from JSON) vs enabled (unpickle).
+
+Usage: python -m python_nlp_service.scripts.bench_config_startup [runs]
+Each run is a new interpreter that imports config_loader and gets every
+registered asset; reports the best wall time and the peak RSS growth.
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+CHILD = """
+import json, resource, time
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+from python_nlp_service.modules.config_loader import CONFIG
+for name in ("skills_map", "skill_synonyms", "action_verbs", "skill_names", "skill_lookup", "skill_matcher", "cert_index"):
+    CONFIG.get(name)
+elapsed = time.perf_counter() - t0
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+print(json.dumps({"ms": elapsed * 1000, "rss_kb": rss_kb, "loaded": CONFIG.loaded()}))
+"""
+
+
+def run(snapshot_dir):
+    env = dict(os.environ, CONFIG_SNAPSHOT_DIR=snapshot_dir)
+    out = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        run(snapshot_dir)  # writes the snapshots
+        results = {
+            "rebuild from JSON": [run("") for _ in range(runs)],
+            "from snapshot": [run(snapshot_dir) for _ in range(runs)],
+        }
+    print(f"best of {runs} fresh interpreters")
+    for mode, samples in results.items():
+        best = min(samples, key=lambda r: r["ms"])
+        print(f"{mode:<18}: {best['ms']:7.1f} ms  peak RSS +{best['rss_kb'] / 1024:5.1f} MiB")
+        for name, info in best["loaded"].items():
+            print(f"    {name:<15} {info['from']:<9} {info['ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
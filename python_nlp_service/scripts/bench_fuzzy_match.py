@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_fuzzy_match.py
+"""
+Benchmark pairwise SequenceMatcher skill matching against FuzzySkillIndex.
+
+Usage: python -m python_nlp_service.scripts.bench_fuzzy_match [resume_skills] [num_jds]
+Defaults to 50 resume skills x 1,000 synthetic JDs drawn from skills_map_final.json,
+with typos injected so the fuzzy branch is exercised.
+"""
+import sys
+import json
+import time
+import random
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from python_nlp_service.modules.fuzzy_matcher import FuzzySkillIndex
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def typo(rng, s):
+    if len(s) < 4:
+        return s
+    i = rng.randrange(len(s))
+    op = rng.choice(["drop", "swap", "dup", "case"])
+    if op == "drop":
+        return s[:i] + s[i + 1:]
+    if op == "swap" and i < len(s) - 1:
+        return s[:i] + s[i + 1] + s[i] + s[i + 2:]
+    if op == "dup":
+        return s[:i] + s[i] + s[i:]
+    return s.upper()
+
+
+def legacy_match(norm_resume, norm_jd):
+    """Matching loop of match_skills before FuzzySkillIndex (normalization excluded)."""
+    matched = set()
+    for jd_skill in norm_jd:
+        for rs in norm_resume:
+            if jd_skill.lower() == rs.lower() or SequenceMatcher(None, jd_skill.lower(), rs.lower()).ratio() > 0.75:
+                matched.add(jd_skill)
+                break
+    return matched
+
+
+def main():
+    n_resume = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n_jds = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(5)
+    with open(ROOT / "config/skills_map_final.json", "r", encoding="utf-8") as f:
+        vocab = sorted(set(json.load(f).values()))
+
+    resume = [typo(rng, s) if rng.random() < 0.3 else s for s in rng.sample(vocab, n_resume)]
+    jds = []
+    for _ in range(n_jds):
+        skills = []
+        for _ in range(rng.randint(5, 15)):
+            s = rng.choice(resume) if rng.random() < 0.3 else rng.choice(vocab)
+            skills.append(typo(rng, s) if rng.random() < 0.3 else s)
+        jds.append(skills)
+
+    t0 = time.perf_counter()
+    legacy = [legacy_match(resume, jd) for jd in jds]
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = FuzzySkillIndex(resume)
+    fast = [{s for s in jd if index.matches(s)} for jd in jds]
+    t_fast = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(legacy, fast) if a != b)
+    print(f"{n_resume} resume skills x {n_jds} JDs")
+    print(f"pairwise SequenceMatcher : {t_legacy * 1000:9.1f} ms")
+    print(f"FuzzySkillIndex          : {t_fast * 1000:9.1f} ms  ({t_legacy / t_fast:.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} JDs differ")
+        sys.exit(1)
+    print("✅ Identical matched sets for every JD")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_jd_fallback.py
+"""
+Benchmark NearestJDIndex (the JD fallback for unmatched job titles) and check
+its top-k against a linear scan that scores every JD.
+
+Usage: python -m python_nlp_service.scripts.bench_jd_fallback [num_jds]
+The corpus is job_dataset.json replicated to num_jds JDs (default: the dataset
+as is), with numbered title variants. Queries are title rewrites that the
+title/level filter does not match ("Backend Developer", "ML Engineer", ...).
+"""
+import sys
+import json
+import time
+import random
+from pathlib import Path
+
+from python_nlp_service.modules.jd_index import JobIndex, NearestJDIndex, normalize_text
+
+ROOT = Path(__file__).resolve().parents[1]
+QUERIES = [
+    ("Backend Developer", ""), ("Front End Engineer", "Senior"), ("ML Engineer", ""),
+    ("Data Analyst", "Fresher"), ("Product Owner", "Lead"), ("Site Reliability Engineer", ""),
+    ("Software Engineer Intern", "Entry Level"), ("Junior Web Developer", ""), ("Nonexistent Role", ""),
+]
+
+
+def linear_scan(index, job_title, experience_level, k, min_similarity):
+    """Same ranking, scoring every JD's title and description vector one by one."""
+    titles = index._titles.cosine(job_title)
+    descriptions = index._descriptions.cosine(job_title)
+    tid_of = {pos: tid for tid, positions in enumerate(index._title_positions) for pos in positions}
+    did_of = {pos: did for did, positions in enumerate(index._description_positions) for pos in positions}
+    scored = []
+    for pos in range(len(index)):
+        score = index.title_weight * titles.get(tid_of[pos], 0.0) + (1 - index.title_weight) * descriptions.get(did_of[pos], 0.0)
+        if score >= min_similarity:
+            scored.append((pos, score))
+    level = normalize_text(experience_level)
+    if level:
+        scored = [(p, s) for p, s in scored if level in index._levels[p]] or scored
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:k]
+
+
+def main():
+    with open(ROOT / "datasets/job_descriptions/job_dataset.json", "r", encoding="utf-8") as f:
+        base = json.load(f)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else len(base)
+    rng = random.Random(9)
+    dataset = base if n == len(base) else [
+        {**base[i % len(base)], "Title": f"{base[i % len(base)]['Title']} {rng.randint(1, max(1, n // 500))}"}
+        for i in range(n)
+    ]
+
+    t0 = time.perf_counter()
+    index = NearestJDIndex(dataset)
+    t_build = time.perf_counter() - t0
+    job_index = JobIndex(dataset)
+
+    latencies, scan_latencies = [], []
+    for title, level in QUERIES:
+        if job_index.lookup_positions(title, level):
+            print(f"⚠️ '{title}' matches by title; the fallback would not run")
+        t0 = time.perf_counter()
+        nearest = index.nearest_positions(title, level)
+        latencies.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        expected = linear_scan(index, title, level, 25, 0.3)
+        scan_latencies.append(time.perf_counter() - t0)
+        if [(p, round(s, 9)) for p, s in nearest] != [(p, round(s, 9)) for p, s in expected]:
+            print(f"❌ '{title}': index top-k differs from the linear scan")
+            sys.exit(1)
+        top = sorted({dataset[pos]["Title"] for pos, _ in nearest[:5]})
+        print(f"{title + (' / ' + level if level else ''):<35} {len(nearest):3d} JDs  best {nearest[0][1] if nearest else 0:.2f}  {top}")
+
+    latencies.sort()
+    scan_latencies.sort()
+    print(f"{len(dataset)} JDs, build {t_build * 1000:.0f} ms, query p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, "
+          f"max {latencies[-1] * 1000:.2f} ms (linear scan p50 {scan_latencies[len(scan_latencies) // 2] * 1000:.2f} ms)")
+    print("✅ Top-k matches the linear scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_jd_index.py
+"""
+Micro-benchmark: linear normalize_text scan vs JobIndex.lookup on a synthetic JD corpus.
+
+Usage: python -m python_nlp_service.scripts.bench_jd_index [num_jds]
+"""
+import sys
+import time
+import random
+
+from python_nlp_service.modules.jd_index import JobIndex, normalize_text
+
+SENIORITY = ["", "Junior", "Senior", "Lead", "Principal", "Staff", "Sr."]
+DOMAIN = ["Software", "Data", "Backend", "Frontend", "Full-Stack", "Cloud", "DevOps", "ML", "Security",
+          "Mobile", "Embedded", "QA", "Platform", "Site Reliability", "Game", "Blockchain", "BI"]
+ROLE = ["Developer", "Engineer", "Architect", "Analyst", "Scientist", "Manager", "Consultant", "Intern"]
+LEVELS = ["Fresher", "Entry Level", "Junior", "Mid Level", "Mid-Senior", "Senior", "Lead", "Director"]
+
+QUERIES = [
+    ("Software Developer", ""), ("Software Developer", "Fresher"), ("Senior", "Senior"),
+    ("data scientist", "mid level"), ("ML Engineer", ""), ("Architect", "Lead"),
+    ("sr", ""), ("", "Entry Level"), ("Quantum Poet", ""), ("", ""),
+]
+
+
+def synthetic_dataset(n, seed=11):
+    rng = random.Random(seed)
+    dataset = []
+    for i in range(n):
+        title = " ".join(p for p in (rng.choice(SENIORITY), rng.choice(DOMAIN), rng.choice(ROLE)) if p)
+        if rng.random() < 0.3:
+            title += f" - Team {rng.randint(1, 400)}"
+        dataset.append({"Title": title, "ExperienceLevel": rng.choice(LEVELS), "Skills": []})
+    return dataset
+
+
+def linear_lookup(dataset, job_title, experience_level):
+    input_title = normalize_text(job_title)
+    input_exp = normalize_text(experience_level)
+    return [
+        jd for jd in dataset
+        if input_title in normalize_text(jd.get("Title", ""))
+        and input_exp in normalize_text(jd.get("ExperienceLevel", ""))
+    ]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dataset = synthetic_dataset(n)
+
+    t0 = time.perf_counter()
+    index = JobIndex(dataset)
+    print(f"Built JobIndex over {n} JDs in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    print(f"{'query':<36}{'matches':>9}{'linear ms':>12}{'index ms':>11}")
+
+    ok = True
+    for title, level in QUERIES:
+        t0 = time.perf_counter()
+        expected = linear_lookup(dataset, title, level)
+        t_linear = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        got = index.lookup(title, level)
+        t_index = time.perf_counter() - t0
+
+        same = len(got) == len(expected) and all(a is b for a, b in zip(got, expected))
+        ok &= same
+        label = f"{title!r}/{level!r}"
+        print(f"{label:<36}{len(expected):>9}{t_linear * 1000:>12.2f}{t_index * 1000:>11.2f}{'' if same else '  ❌ MISMATCH'}")
+
+    if not ok:
+        sys.exit(1)
+    print("✅ Index returns the same relevant_jds as the linear scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_pdf_parallel.py
+"""
+Benchmark sequential vs page-parallel extract_pdf_data to find the page count
+where the worker processes start paying off (PDF_PARALLEL_MIN_PAGES).
+
+Usage: python -m python_nlp_service.scripts.bench_pdf_parallel [max_pages] [workers]
+Builds synthetic text-heavy resumes (two-column blocks, a logo on every page)
+of increasing length and times both modes on the in-memory bytes, warm pool.
+"""
+import sys
+import time
+
+import fitz  # PyMuPDF
+
+from python_nlp_service.modules import pdf_pages
+from python_nlp_service.modules.resume_parser import extract_pdf_data
+
+REPEAT = 5
+
+
+def build_pdf(pages: int) -> bytes:
+    logo = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+    logo.clear_with(180)
+    logo_png = logo.tobytes("png")
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(500, 20, 560, 80), stream=logo_png)
+        for col, x in enumerate((40, 310)):
+            lines = [f"Page {p + 1} col {col} - Built Python/Django services, reduced latency by {i}% using Redis and AWS"
+                     for i in range(45)]
+            page.insert_textbox(fitz.Rect(x, 90, x + 250, 800), "\n".join(lines), fontsize=6)
+    return doc.tobytes()
+
+
+def timed(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    max_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    if len(sys.argv) > 2:
+        pdf_pages.PARALLEL_WORKERS = int(sys.argv[2])
+    sizes = [n for n in (1, 2, 4, 8, 12, 16, 24, 32, 48, 64, 96) if n <= max_pages]
+
+    # spawn + import in every worker once, outside the timings
+    extract_pdf_data(build_pdf(pdf_pages.PARALLEL_WORKERS * 2), parallel=True)
+
+    print(f"workers={pdf_pages.PARALLEL_WORKERS}, best of {REPEAT}")
+    print(f"{'pages':>5} {'sequential':>12} {'parallel':>12} {'speedup':>8}")
+    speedups = []
+    for n in sizes:
+        data = build_pdf(n)
+        t_seq, seq = timed(lambda: extract_pdf_data(data, parallel=False))
+        t_par, par = timed(lambda: extract_pdf_data(data, parallel=True))
+        if seq != par:
+            print(f"❌ outputs differ at {n} pages")
+            sys.exit(1)
+        speedup = t_seq / t_par
+        speedups.append((n, speedup))
+        print(f"{n:>5} {t_seq * 1000:>10.1f}ms {t_par * 1000:>10.1f}ms {speedup:>7.2f}x")
+
+    print("✅ Identical blocks/text/images in both modes")
+    # smallest size from which parallel stays at least 10% faster
+    crossover = None
+    for n, speedup in reversed(speedups):
+        if speedup < 1.1:
+            break
+        crossover = n
+    found = f"{crossover} pages" if crossover else "not reached"
+    print(f"Crossover: {found} (current PDF_PARALLEL_MIN_PAGES={pdf_pages.PARALLEL_MIN_PAGES})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_resume_index.py
+"""
+Benchmark ResumeIndex candidate search on synthetic parsed resumes and check
+its rankings against a brute-force pass over every stored resume.
+
+Usage: python -m python_nlp_service.scripts.bench_resume_index [num_resumes] [num_queries] [db_path]
+Resumes get 5-30 skills drawn (skewed towards popular ones) from the skills of
+job_dataset.json, 0-20 years of experience and 0-2 certifications. Queries are
+the skills of random JDs from the dataset. db_path defaults to a temp file.
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+from pathlib import Path
+
+from python_nlp_service.modules.resume_index import ResumeIndex
+
+ROOT = Path(__file__).resolve().parents[1]
+CERTS = ["aws certified solutions architect", "pmp", "cka", "google cloud professional", "scrum master"]
+
+
+def synthetic_resumes(n, vocab, rng):
+    weights = [1 / (i + 1) for i in range(len(vocab))]  # Zipf-like skill popularity
+    for i in range(n):
+        yield f"r{i:07d}", {
+            "skills": sorted(set(rng.choices(vocab, weights, k=rng.randint(5, 30)))),
+            "years_experience": rng.randint(0, 20),
+            "certifications": rng.sample(CERTS, rng.randint(0, 2)),
+        }, f"resume_{i}.pdf"
+
+
+def brute_force(resumes, jd_skills, top_n, min_years=None):
+    wanted = set(jd_skills)
+    scored = []
+    for resume_id, data, _ in resumes:
+        if min_years is not None and data["years_experience"] < min_years:
+            continue
+        hits = len(wanted & set(data["skills"]))
+        if hits:
+            scored.append((-hits, -data["years_experience"], resume_id))
+    return [resume_id for _, _, resume_id in sorted(scored)[:top_n]]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(11)
+    with open(ROOT / "datasets/job_descriptions/job_dataset.json", "r", encoding="utf-8") as f:
+        dataset = [jd for jd in json.load(f) if jd.get("Skills")]
+    vocab = sorted({s.lower() for jd in dataset for s in jd["Skills"]})
+    rng.shuffle(vocab)
+
+    if len(sys.argv) > 3:
+        db_path = sys.argv[3]
+    else:
+        fd, db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+    index = ResumeIndex(db_path, normalize=str.lower)  # any normalizer exercises the same index
+
+    t0 = time.perf_counter()
+    batch = []
+    for item in synthetic_resumes(n, vocab, random.Random(13)):
+        batch.append(item)
+        if len(batch) == 5000:
+            index.add_many(batch)
+            batch = []
+    index.add_many(batch)
+    t_build = time.perf_counter() - t0
+
+    queries = [[s.lower() for s in rng.choice(dataset)["Skills"]] for _ in range(num_queries)]
+    latencies = []
+    for skills in queries:
+        t0 = time.perf_counter()
+        index.search(skills, top_n=10)
+        latencies.append(time.perf_counter() - t0)
+    latencies.sort()
+
+    # incremental updates: replace one resume, remove another
+    t0 = time.perf_counter()
+    index.add("r0000000", {"skills": queries[0], "years_experience": 99, "certifications": []})
+    t_add = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    index.remove("r0000001")
+    t_remove = time.perf_counter() - t0
+
+    # correctness: rankings equal a brute-force pass over the same resumes
+    resumes = [r for r in synthetic_resumes(n, vocab, random.Random(13)) if r[0] not in ("r0000000", "r0000001")]
+    resumes.append(("r0000000", {"skills": queries[0], "years_experience": 99}, None))
+    for skills in queries[:3]:
+        for min_years in (None, 10):
+            got = [c["resume_id"] for c in index.search(skills, 10, min_years)["candidates"]]
+            if got != brute_force(resumes, skills, 10, min_years):
+                print(f"❌ ranking differs from brute force (min_years={min_years})")
+                sys.exit(1)
+    if index.search(queries[0], 1)["candidates"][0]["resume_id"] != "r0000000" or "r0000001" in index:
+        print("❌ incremental add/remove not reflected in search")
+        sys.exit(1)
+
+    stats = index.stats(postings=True)
+    print(f"{stats['resumes']} resumes, {stats['skills']} distinct skills, {stats['postings']} postings")
+    print(f"build (bulk)   : {t_build:9.1f} s  ({os.path.getsize(db_path) / 2 ** 20:.0f} MiB on disk)")
+    print(f"add / remove   : {t_add * 1000:.2f} / {t_remove * 1000:.2f} ms")
+    print(f"query p50 / p95: {latencies[len(latencies) // 2] * 1000:.2f} / {latencies[int(len(latencies) * 0.95)] * 1000:.2f} ms")
+    print("✅ Top-10 rankings match the brute-force pass")
+    index.close()
+    if len(sys.argv) <= 3:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.unlink(db_path + suffix)
+
+
+if __name__ == "__main__":
+    main()
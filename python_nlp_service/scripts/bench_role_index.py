@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_role_index.py
+"""
+Benchmark RoleIndex (best-fit roles) on a scaled-up JD corpus and check its
+scores against a brute-force pass over every JD.
+
+Usage: python -m python_nlp_service.scripts.bench_role_index [num_jds] [num_queries]
+The corpus is job_dataset.json replicated to num_jds JDs (default 100000), with
+numbered title variants so the number of distinct roles grows with it.
+"""
+import sys
+import json
+import time
+import random
+from collections import defaultdict
+from pathlib import Path
+
+from python_nlp_service.modules.role_index import RoleIndex
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def scaled_dataset(base, n, rng):
+    dataset = []
+    for i in range(n):
+        jd = base[i % len(base)]
+        dataset.append({
+            "Title": f"{jd['Title']} {rng.randint(1, max(1, n // 500))}",
+            "ExperienceLevel": jd["ExperienceLevel"],
+            "Skills": rng.sample(jd["Skills"], len(jd["Skills"])) if jd["Skills"] else [],
+        })
+    return dataset
+
+
+def brute_force(dataset, skills, normalize):
+    per_role = defaultdict(list)
+    for jd in dataset:
+        raw = jd.get("Skills", []) or []
+        norm = {normalize(s) for s in raw}
+        per_role[(jd["Title"], jd["ExperienceLevel"])].append(len(norm & skills) / len(raw) if raw else 0.0)
+    return {role: round(sum(v) / len(v) * 100, 2) for role, v in per_role.items()}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(5)
+    with open(ROOT / "datasets/job_descriptions/job_dataset.json", "r", encoding="utf-8") as f:
+        base = json.load(f)
+    dataset = scaled_dataset(base, n, rng)
+    normalize = str.lower  # the scorer passes normalize_skill; any normalizer exercises the same index
+
+    t0 = time.perf_counter()
+    index = RoleIndex(dataset, normalize)
+    t_build = time.perf_counter() - t0
+
+    vocab = sorted({normalize(s) for jd in dataset for s in jd["Skills"]})
+    queries = [set(rng.sample(vocab, rng.randint(8, 40))) for _ in range(num_queries)]
+    latencies = []
+    for skills in queries:
+        t0 = time.perf_counter()
+        index.top_roles(skills, k=10)
+        latencies.append(time.perf_counter() - t0)
+    latencies.sort()
+
+    # correctness on a few queries: every top-10 score equals the brute-force mean
+    for skills in queries[:3]:
+        expected = brute_force(dataset, skills, normalize)
+        for role in index.top_roles(skills, k=10):
+            want = expected[(role["title"], role["experience_level"])]
+            if abs(role["score_percent"] - want) > 1e-9:
+                print(f"❌ {role['title']} / {role['experience_level']}: {role['score_percent']} != {want}")
+                sys.exit(1)
+        best = max(expected.values())
+        if index.top_roles(skills, k=1)[0]["score_percent"] != best:
+            print("❌ top role is not the brute-force best")
+            sys.exit(1)
+
+    print(f"{n} JDs, {len(index)} roles, {len(vocab)} distinct skills")
+    print(f"build          : {t_build * 1000:9.1f} ms")
+    print(f"query p50 / p95: {latencies[len(latencies) // 2] * 1000:.2f} / {latencies[int(len(latencies) * 0.95)] * 1000:.2f} ms")
+    print("✅ Top-10 scores match the brute-force pass")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_section_detector.py
+"""
+Benchmark the per-pattern section header loop against SECTION_HEADER_RE and
+check that parse_resume_sections output is unchanged.
+
+Usage: python -m python_nlp_service.scripts.bench_section_detector [resume_dir] [num_synthetic]
+resume_dir: PDF/DOCX/TXT resumes to use as the corpus (text extracted and cleaned
+as parse_resume does). Without it, a synthetic corpus is generated from the config
+files, with headers in varied styles, inline headers and lines naming several sections.
+"""
+import sys
+import json
+import time
+import random
+from collections import defaultdict
+from pathlib import Path
+
+from python_nlp_service.modules.resume_parser import (
+    SECTION_PATTERNS, clean_text, extract_pdf_data, extract_text_from_docx, parse_resume_sections,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEADERS = [
+    "SUMMARY", "Professional Summary", "About Me", "Profile", "TECHNICAL SKILLS", "Technical  Skills:",
+    "Core Competencies", "Key Skills", "Experience", "WORK EXPERIENCE", "Professional Experience",
+    "Employment History", "Projects", "Academic Projects", "Open-Source Projects", "Education",
+    "Education & Qualifications", "Certifications", "Licenses", "Courses", "Achievements", "Awards",
+    "Honors", "Publications", "Professional Background",
+]
+FILLER = [
+    "Worked closely with product and design teams",
+    "Mentored two junior engineers and reviewed pull requests",
+    "Reduced page load time by 35% through caching",
+    "B.Tech in Computer Science, 2019 - 2023, CGPA 8.4",
+    "Led a team of 4 on the projects dashboard and reporting experience",
+    "Skilled communicator with a strong profile in customer support",
+    "Jan 2021 - Present | Acme Corp | Software Engineer",
+    "john.doe@example.com | +1 555 010 0199 | linkedin.com/in/johndoe",
+]
+
+
+def legacy_sections(text):
+    """parse_resume_sections as it was before SECTION_HEADER_RE."""
+    lines = [ln.rstrip() for ln in text.splitlines()]
+    sections_lines = defaultdict(list)
+    current = None
+    for ln in lines:
+        stripped = ln.strip()
+        if not stripped:
+            continue
+        matched = None
+        match_obj = None
+        for name, pattern in SECTION_PATTERNS.items():
+            m = pattern.search(stripped)
+            if m:
+                matched = name
+                match_obj = m
+                break
+        if matched:
+            after = stripped[match_obj.end():].strip(" :\t-–—")
+            current = matched
+            if after:
+                sections_lines[current].append(after)
+            else:
+                sections_lines[current] = sections_lines.get(current, [])
+        elif current:
+            sections_lines[current].append(stripped)
+        else:
+            sections_lines["preamble"].append(stripped)
+    sections = {k: "\n".join(v).strip() for k, v in sections_lines.items()}
+    sections["__sections_lines"] = sections_lines
+    return sections
+
+
+def load_corpus(resume_dir):
+    texts = []
+    for path in sorted(Path(resume_dir).iterdir()):
+        suffix = path.suffix.lower()
+        if suffix == ".pdf":
+            texts.append(clean_text(extract_pdf_data(str(path))["text"]))
+        elif suffix == ".docx":
+            texts.append(clean_text(extract_text_from_docx(str(path))))
+        elif suffix == ".txt":
+            texts.append(clean_text(path.read_text(encoding="utf-8", errors="ignore")))
+    return texts
+
+
+def synthetic_corpus(n, rng):
+    with open(ROOT / "config/skills_map_final.json", "r", encoding="utf-8") as f:
+        skills = sorted(set(json.load(f).values()))
+    with open(ROOT / "config/action_verbs.json", "r", encoding="utf-8") as f:
+        verbs = json.load(f)
+    texts = []
+    for _ in range(n):
+        lines = ["John Doe", rng.choice(FILLER)]
+        for header in rng.sample(HEADERS, rng.randint(4, 9)):
+            inline = rng.random() < 0.3
+            lines.append(f"{header}: {', '.join(rng.sample(skills, 3))}" if inline else header)
+            for _ in range(rng.randint(3, 12)):
+                if rng.random() < 0.6:
+                    lines.append(f"• {rng.choice(verbs).capitalize()} {' and '.join(rng.sample(skills, 2))} services")
+                else:
+                    lines.append(rng.choice(FILLER))
+            lines.append("")
+        texts.append("\n".join(lines))
+    return texts
+
+
+def main():
+    rng = random.Random(11)
+    if len(sys.argv) > 1 and Path(sys.argv[1]).is_dir():
+        texts = load_corpus(sys.argv[1])
+        source = sys.argv[1]
+    else:
+        n = int(sys.argv[-1]) if len(sys.argv) > 1 and sys.argv[-1].isdigit() else 500
+        texts = synthetic_corpus(n, rng)
+        source = "synthetic"
+    num_lines = sum(len(t.splitlines()) for t in texts)
+
+    t0 = time.perf_counter()
+    legacy = [legacy_sections(t) for t in texts]
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fast = [parse_resume_sections(t) for t in texts]
+    t_fast = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(legacy, fast) if a != b)
+    print(f"{len(texts)} resumes ({source}), {num_lines} lines")
+    print(f"per-pattern loop    : {t_legacy * 1000:9.1f} ms")
+    print(f"SECTION_HEADER_RE   : {t_fast * 1000:9.1f} ms  ({t_legacy / t_fast:.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} resumes differ")
+        sys.exit(1)
+    print("✅ Identical sections for every resume")
+
+
+if __name__ == "__main__":
+    main()
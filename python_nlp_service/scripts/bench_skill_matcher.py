@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/bench_skill_matcher.py
+"""
+Compare the legacy per-skill regex scan against SKILL_MATCHER.
+
+Usage: python -m python_nlp_service.scripts.bench_skill_matcher [resume.pdf|resume.txt ...]
+Without arguments a synthetic corpus is generated from the skill configs.
+"""
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+from python_nlp_service.modules import resume_parser
+from python_nlp_service.modules.resume_parser import (
+    SKILL_SYNONYMS, SKILLS_MAP, SKILL_MATCHER, extract_skills_from_text,
+)
+
+FILLER = (
+    "Developed and deployed services, improved latency by 35% and mentored interns. "
+    "Worked with cross-functional teams on data pipelines, dashboards and code reviews."
+).split()
+
+# boundary edge cases the regex path is known to handle
+EDGE_CASES = [
+    "C++, C# and Node.js developer", "c++11 / c#8 / node.jsx", "Skills: React.js; ReactJS, (Vue.js)",
+    "asp.net-core and .NET framework", "python3.10 python_3 py", "CI/CD, ci/cd pipelines",
+]
+
+
+def legacy_extract_skills(text):
+    """The pre-SkillMatcher implementation, kept verbatim for comparison."""
+    text_lower = (text or "").lower()
+    found = set()
+    for canonical, variants in SKILL_SYNONYMS.items():
+        for v in variants:
+            if re.search(rf'(?<!\w){re.escape(v.lower())}(?!\w)', text_lower):
+                found.add(canonical)
+    for raw, canonical in SKILLS_MAP.items():
+        if re.search(rf'(?<!\w){re.escape(raw.lower())}(?!\w)', text_lower):
+            found.add(canonical)
+    return sorted(found)
+
+
+def synthetic_corpus(n_docs=50, seed=7):
+    rng = random.Random(seed)
+    variants = list(SKILLS_MAP.keys()) + [v for vs in SKILL_SYNONYMS.values() for v in vs]
+    docs = list(EDGE_CASES)
+    for _ in range(n_docs):
+        words = []
+        for _ in range(600):
+            if rng.random() < 0.08:
+                v = rng.choice(variants)
+                words.append(v.upper() if rng.random() < 0.2 else v)
+            else:
+                words.append(rng.choice(FILLER))
+            if rng.random() < 0.05:
+                words.append(rng.choice([",", "/", "-", "(", ")", ";", "\n", "•"]))
+        docs.append(" ".join(words))
+    return docs
+
+
+def load_corpus(paths):
+    docs = []
+    for p in paths:
+        if p.lower().endswith((".pdf", ".docx")):
+            docs.append(resume_parser.parse_resume(p)["raw_text"])
+        else:
+            docs.append(Path(p).read_text(encoding="utf-8"))
+    return docs
+
+
+def main():
+    docs = load_corpus(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_corpus()
+    print(f"Automaton states: {SKILL_MATCHER.num_states}, documents: {len(docs)}")
+
+    t0 = time.perf_counter()
+    legacy = [legacy_extract_skills(d) for d in docs]
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fast = [extract_skills_from_text(d) for d in docs]
+    t_fast = time.perf_counter() - t0
+
+    mismatches = [i for i, (a, b) in enumerate(zip(legacy, fast)) if a != b]
+    print(f"legacy regex : {t_legacy * 1000 / len(docs):8.2f} ms/doc")
+    print(f"SkillMatcher : {t_fast * 1000 / len(docs):8.2f} ms/doc  ({t_legacy / t_fast:.1f}x)")
+    if mismatches:
+        for i in mismatches[:5]:
+            print(f"❌ doc {i}: legacy-only={sorted(set(legacy[i]) - set(fast[i]))} "
+                  f"matcher-only={sorted(set(fast[i]) - set(legacy[i]))}")
+        sys.exit(1)
+    print(f"✅ Identical matches on all {len(docs)} documents")
+
+
+if __name__ == "__main__":
+    main()
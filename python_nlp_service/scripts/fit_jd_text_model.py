@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# python_nlp_service/scripts/fit_jd_text_model.py
+"""
+Fit the JD-corpus TF-IDF model offline and write its config snapshot, so
+workers unpickle it instead of fitting at startup; then compare per-request
+text similarity against the old pairwise SimilarityScorer.
+
+Usage: python -m python_nlp_service.scripts.fit_jd_text_model [num_jds_per_request]
+Run it after deploying a new job_dataset.json (CONFIG_SNAPSHOT_DIR must be set,
+which it is by default). The benchmark scores synthetic resume texts against
+num_jds_per_request JDs (default 200): the old path fits a vectorizer on every
+(resume, JD) pair, the new one is one transform and one sparse mat-vec.
+"""
+import sys
+import json
+import time
+import random
+from pathlib import Path
+
+from python_nlp_service.modules.config_loader import CONFIG, SNAPSHOT_DIR
+from python_nlp_service.modules.similarity_scorer import SKLEARN_AVAILABLE, SimilarityScorer, jd_text, resume_text
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def main():
+    if not SKLEARN_AVAILABLE:
+        print("❌ scikit-learn is required (pip install scikit-learn)")
+        sys.exit(1)
+    if not SNAPSHOT_DIR:
+        print("❌ CONFIG_SNAPSHOT_DIR is empty: the fitted model would not be persisted")
+        sys.exit(1)
+    per_request = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    model = CONFIG.get("jd_text_model")
+    info = CONFIG.loaded()["jd_text_model"]
+    print(f"{len(model)} JDs, {len(model.vocabulary)} terms, {model.matrix.nnz} non-zeros "
+          f"({info['from']} in {info['ms']} ms; snapshot dir {SNAPSHOT_DIR})")
+
+    with open(ROOT / "datasets/job_descriptions/job_dataset.json", "r", encoding="utf-8") as f:
+        dataset = json.load(f)
+    rng = random.Random(3)
+    resumes = []
+    for _ in range(20):
+        jd = rng.choice(dataset)
+        resumes.append({
+            "skills": rng.sample(jd["Skills"], min(len(jd["Skills"]), 6)),
+            "education": ["B.Tech Computer Science 2016 - 2020"],
+            "experience": jd.get("Responsibilities", ""),
+            "projects": "Built a REST API in Python and deployed it with Docker",
+        })
+    positions = sorted(rng.sample(range(len(dataset)), min(per_request, len(dataset))))
+    rows = model.rows(positions)
+
+    t0 = time.perf_counter()
+    old = [[SimilarityScorer(r, dataset[pos]).compute_similarity() for pos in positions] for r in resumes[:3]]
+    t_old = (time.perf_counter() - t0) / 3
+
+    t0 = time.perf_counter()
+    new = [model.similarities(resume_text(r), rows=rows) for r in resumes]
+    t_new = (time.perf_counter() - t0) / len(resumes)
+
+    # the corpus model must agree with scoring each pair through it one at a time
+    for r, sims in zip(resumes[:3], new):
+        for pos, sim in zip(positions[:20], sims):
+            single = SimilarityScorer(r, dataset[pos], model=model).compute_similarity()
+            if abs(single - sim) > 1e-3:
+                print(f"❌ batch {sim:.4f} != pairwise {single:.4f} for JD {pos} ({jd_text(dataset[pos])[:40]}...)")
+                sys.exit(1)
+
+    mean_old = sum(map(sum, old)) / sum(map(len, old))
+    mean_new = sum(map(sum, new[:3])) / sum(map(len, new[:3]))
+    print(f"per request vs {len(positions)} JDs: pairwise fit {t_old * 1000:8.1f} ms, corpus model {t_new * 1000:6.2f} ms "
+          f"({t_old / t_new:.0f}x)")
+    print(f"mean similarity: pairwise {mean_old:.1f}, corpus IDF {mean_new:.1f}")
+    print("✅ Batch similarities match the pairwise scorer with the same model")
+
+
+if __name__ == "__main__":
+    main()